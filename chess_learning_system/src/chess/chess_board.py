@@ -38,6 +38,25 @@ class ChessBoard:
         
     def draw(self):
         """Draw the chess board and pieces"""
+        self._draw_board(self.screen, self.board_offset_x, self.board_offset_y)
+        
+        # Draw highlights and selections
+        self._draw_overlays()
+    
+    def render_to_surface(self) -> pygame.Surface:
+        """Render squares, labels and pieces into an offscreen surface"""
+        surface = pygame.Surface((self.board_size, self.board_size)).convert()
+        self._draw_board(surface, 0, 0)
+        return surface
+    
+    def draw_overlays(self):
+        """Draw only highlights and selections (on top of a cached board)"""
+        self._draw_overlays()
+    
+    def _draw_board(self, target: pygame.Surface, offset_x: int, offset_y: int):
+        """Draw squares, labels and pieces onto target at the given offset"""
+        label_font = self.resource_manager.load_font(None, 20)
+        
         # Draw board squares
         for row in range(8):
             for col in range(8):
@@ -47,40 +66,36 @@ class ChessBoard:
                 
                 # Draw square
                 rect = pygame.Rect(
-                    col * self.square_size + self.board_offset_x,
-                    (7 - row) * self.square_size + self.board_offset_y,  # Flip for correct orientation
+                    col * self.square_size + offset_x,
+                    (7 - row) * self.square_size + offset_y,  # Flip for correct orientation
                     self.square_size,
                     self.square_size
                 )
-                pygame.draw.rect(self.screen, color, rect)
+                pygame.draw.rect(target, color, rect)
                 
                 # Draw file and rank labels
                 if row == 0:  # Bottom row - file labels
                     label = chr(ord('a') + col)
-                    font = pygame.font.Font(None, 20)
-                    text = font.render(label, True, 
+                    text = label_font.render(label, True, 
                                      self.dark_square_color if is_light else self.light_square_color)
                     text_rect = text.get_rect(bottomright=(rect.right - 2, rect.bottom - 2))
-                    self.screen.blit(text, text_rect)
+                    target.blit(text, text_rect)
                 
                 if col == 0:  # Left column - rank labels
                     label = str(row + 1)
-                    font = pygame.font.Font(None, 20)
-                    text = font.render(label, True,
+                    text = label_font.render(label, True,
                                      self.dark_square_color if is_light else self.light_square_color)
                     text_rect = text.get_rect(topleft=(rect.left + 2, rect.top + 2))
-                    self.screen.blit(text, text_rect)
+                    target.blit(text, text_rect)
         
         # Draw pieces
         for square in chess.SQUARES:
             piece = self.board.piece_at(square)
             if piece:
-                self._draw_piece(piece, square)
-        
-        # Draw highlights and selections
-        self._draw_overlays()
+                self._draw_piece(piece, square, target, offset_x, offset_y)
     
-    def _draw_piece(self, piece: chess.Piece, square: int):
+    def _draw_piece(self, piece: chess.Piece, square: int, target: pygame.Surface,
+                    offset_x: int, offset_y: int):
         """Draw a chess piece at the given square"""
         col = chess.square_file(square)
         row = chess.square_rank(square)
@@ -95,10 +110,10 @@ class ChessBoard:
         )
         
         # Calculate position (centered in square)
-        x = col * self.square_size + self.board_offset_x + 5
-        y = (7 - row) * self.square_size + self.board_offset_y + 5
+        x = col * self.square_size + offset_x + 5
+        y = (7 - row) * self.square_size + offset_y + 5
         
-        self.screen.blit(piece_image, (x, y))
+        target.blit(piece_image, (x, y))
     
     def _draw_overlays(self):
         """Draw highlights, selections, and other overlays"""
@@ -153,6 +168,18 @@ class ChessBoard:
         if square not in self.highlighted_squares:
             self.highlighted_squares.append(square)
     
+    def highlight_squares(self, squares):
+        """Highlight several squares in one call"""
+        highlighted = self.highlighted_squares
+        for square in squares:
+            if square not in highlighted:
+                highlighted.append(square)
+    
+    def unhighlight_square(self, square: int):
+        """Remove the highlight from a specific square"""
+        if square in self.highlighted_squares:
+            self.highlighted_squares.remove(square)
+    
     def clear_highlights(self):
         """Clear all highlighted squares"""
         self.highlighted_squares.clear()
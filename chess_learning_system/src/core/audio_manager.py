@@ -35,6 +35,10 @@ class AudioManager(metaclass=Singleton):
         if not sound:
             return
         
+        self.play_loaded_sound(sound, volume)
+    
+    def play_loaded_sound(self, sound: pygame.mixer.Sound, volume: Optional[float] = None):
+        """Play an already loaded sound effect"""
         # Set volume
         if volume is None:
             volume = self.effects_volume
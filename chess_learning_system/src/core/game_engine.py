@@ -111,10 +111,13 @@ class ChessEducationEngine(metaclass=Singleton):
             self._check_break_reminder()
             #print("check break reminder is completed from game_engine")
             # Render
-            self._render()
+            dirty_rects = self._render()
             
-            # Update display
-            pygame.display.flip()
+            # Update display: push only what the state reports as changed, else the whole screen
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
             #print("run is completed from game_engine")
     def _handle_events(self):
         """Handle pygame events"""
@@ -135,15 +138,16 @@ class ChessEducationEngine(metaclass=Singleton):
             self.event_manager.handle_event(event)
     
     def _render(self):
-        """Render the current frame"""
+        """Render the current frame; returns the changed rects, or None if the whole screen changed"""
         # Clear screen with background
         self.screen.blit(self.background, (0, 0))
         
         # Render current state
-        self.state_machine.render(self.screen)
+        dirty_rects = self.state_machine.render(self.screen)
         
-        # Render any overlays (e.g., break reminder)
+        # Render any overlays (e.g., break reminder); once these draw, return None here
         self._render_overlays()
+        return dirty_rects
     
     def _render_overlays(self):
         """Render any overlay elements"""
@@ -62,7 +62,9 @@ class ResourceManager:
             
             if not path:
                 print(f"Warning: Image '{name}' not found. Using placeholder.")
-                return self._create_placeholder_image(size or (64, 64))
+                placeholder = self._create_placeholder_image(size or (64, 64))
+                self.images[cache_key] = placeholder
+                return placeholder
         
         try:
             # Load the image
@@ -118,7 +120,9 @@ class ResourceManager:
             
         except Exception as e:
             print(f"Error loading piece image '{piece_type}' ({color}): {e}")
-            return self._create_placeholder_piece(piece_type, color, size or (64, 64))
+            placeholder = self._create_placeholder_piece(piece_type, color, size or (64, 64))
+            self.images[cache_key] = placeholder
+            return placeholder
     
     def load_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
         """Load and cache a sound effect"""
@@ -195,6 +199,10 @@ class ResourceManager:
         pygame.draw.rect(surface, (100, 100, 100), surface.get_rect(), 2)
         pygame.draw.line(surface, (100, 100, 100), (0, 0), size, 2)
         pygame.draw.line(surface, (100, 100, 100), (size[0], 0), (0, size[1]), 2)
+        
+        # Match the display format like loaded images
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
         return surface
     
     def _create_placeholder_piece(self, piece_type: str, color: str, size: Tuple[int, int]) -> pygame.Surface:
@@ -218,6 +226,9 @@ class ResourceManager:
         text_rect = text.get_rect(center=center)
         surface.blit(text, text_rect)
         
+        # Match the display format like loaded images
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
         return surface
     
     def cleanup(self):
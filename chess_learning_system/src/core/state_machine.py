@@ -31,6 +31,9 @@ class GameState(Enum):
 class BaseState:
     """Base class for all game states"""
     
+    __slots__ = ('engine', 'config', 'transition_alpha', 'transitioning_in',
+                 'transitioning_out', '__weakref__')
+    
     def __init__(self, engine):
         self.engine = engine
         self.config = engine.config
@@ -65,7 +68,7 @@ class BaseState:
             #print("elif is completed")
         #print("update function executed basestate")
     def render(self, screen):
-        """Render the state"""
+        """Render the state; may return the list of rects changed since the last frame (None: whole screen)"""
         # Subclasses should override this
         pass
         
@@ -143,7 +146,8 @@ class StateMachine:
     def render(self, screen):
         """Render the current state"""
         if self.current_state:
-            self.current_state.render(screen)
+            return self.current_state.render(screen)
+        return None
     
     def handle_event(self, event):
         """Handle events for the current state"""
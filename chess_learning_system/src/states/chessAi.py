@@ -2,9 +2,11 @@
 # This is the AI brain that calculates the best moves
 
 import random
+import time
 
 # Configuration
 DEPTH = 3  # AI search depth - can be changed for difficulty
+MAX_DEPTH = 6  # deepest iteration findBestMoveTimed will try
 
 def findRandomMove(validMoves):
     """Find a random valid move"""
@@ -50,6 +52,107 @@ def findMoveNegaMaxAlphaBeta(gs, validMoves, depth, alpha, beta, turnMultiplier)
             break
     return maxScore
 
+class SearchTimeout(Exception):
+    """Raised inside the timed search once the deadline has passed"""
+
+
+# Transposition table flags
+EXACT, LOWERBOUND, UPPERBOUND = 0, 1, 2
+
+
+def findBestMoveTimed(gs, validMoves, budget, cancel=None):
+    """
+    Iterative deepening negamax with a transposition table
+    Searches depth 1, 2, ... until the time budget runs out and returns the best move of the
+    deepest finished iteration
+    Setting the optional cancel event stops the search at the next node and returns None
+    """
+    random.shuffle(validMoves)
+    table = {}
+    bestMove = None
+    deadline = time.perf_counter() + budget
+    turnMultiplier = 1 if gs.whiteToMove else -1
+    for depth in range(1, MAX_DEPTH + 1):
+        # depth 1 always finishes so there is a move to play
+        try:
+            score, move = findMoveNegaMaxTT(gs, validMoves, depth, -CHECKMATE, CHECKMATE, turnMultiplier,
+                                            table, deadline if depth > 1 else float('inf'), cancel)
+        except SearchTimeout:
+            if cancel is not None and cancel.is_set():
+                return None
+            break
+        if move is not None:
+            bestMove = move
+            # try the previous best first at the next depth
+            validMoves.remove(move)
+            validMoves.insert(0, move)
+        if abs(score) >= CHECKMATE:
+            break
+    return bestMove
+
+
+def findMoveNegaMaxTT(gs, validMoves, depth, alpha, beta, turnMultiplier, table, deadline, cancel=None):
+    """
+    Negamax with alpha-beta pruning that reuses scores of positions already searched
+    Returns (score, best move) for the position
+    """
+    if time.perf_counter() > deadline or (cancel is not None and cancel.is_set()):
+        raise SearchTimeout
+    if depth == 0 or not validMoves:
+        return turnMultiplier * scoreBoard(gs), None
+
+    key = positionKey(gs)
+    entry = table.get(key)
+    alphaOrig = alpha
+    if entry is not None:
+        entryDepth, entryScore, entryFlag, bestID = entry
+        for i, move in enumerate(validMoves):
+            if move.moveID == bestID:
+                if entryDepth >= depth and (entryFlag == EXACT or
+                                            (entryFlag == LOWERBOUND and entryScore >= beta) or
+                                            (entryFlag == UPPERBOUND and entryScore <= alpha)):
+                    return entryScore, move
+                # search the stored best move first
+                validMoves = [move] + validMoves[:i] + validMoves[i + 1:]
+                break
+
+    maxScore = -CHECKMATE
+    bestMove = None
+    for move in validMoves:
+        gs.makeMove(move)
+        nextMoves = gs.getValidMoves()
+        try:
+            score = -findMoveNegaMaxTT(gs, nextMoves, depth - 1, -beta, -alpha, -turnMultiplier,
+                                       table, deadline, cancel)[0]
+        finally:
+            gs.undoMove()
+        if score > maxScore or bestMove is None:
+            maxScore = score
+            bestMove = move
+        if maxScore > alpha:
+            alpha = maxScore
+        if alpha >= beta:
+            break
+
+    if maxScore <= alphaOrig:
+        flag = UPPERBOUND
+    elif maxScore >= beta:
+        flag = LOWERBOUND
+    else:
+        flag = EXACT
+    table[key] = (depth, maxScore, flag, bestMove.moveID)
+    return maxScore, bestMove
+
+
+def positionKey(gs):
+    """
+    Hashable key for the position: board, side to move, en passant square and castling rights
+    """
+    rights = gs.currentCastlingRights
+    return (''.join(map(''.join, gs.board)), gs.whiteToMove, gs.enpassantPossible,
+            rights.wks, rights.bks, rights.wqs, rights.bqs)
+
+
 def scoreBoard(gs):
     """
     A positive score is good for white, a negative score is good for black.
@@ -63,18 +166,12 @@ def scoreBoard(gs):
         return STALEMATE
 
     score = 0
-    for row in range(len(gs.board)):
-        for col in range(len(gs.board[row])):
-            square = gs.board[row][col]
+    sq = 0
+    for row in gs.board:
+        for square in row:
             if square != "--":
-                # Score it positionally
-                piecePositionScore = 0
-                if square[1] != "K":  # No position table for king
-                    piecePositionScore = piecePositionScores[square][row][col]
-                if square[0] == 'w':
-                    score += pieceScore[square[1]] + piecePositionScore * .1
-                elif square[0] == 'b':
-                    score -= pieceScore[square[1]] + piecePositionScore * .1
+                score += squareScores[square][sq]
+            sq += 1
 
     return score
 
@@ -196,4 +293,22 @@ piecePositionScores = {
            [-0.6, -0.8, -0.8, -1.0, -1.0, -0.8, -0.8, -0.6],
            [-0.6, -0.8, -0.8, -1.0, -1.0, -0.8, -0.8, -0.6],
            [-0.6, -0.8, -0.8, -1.0, -1.0, -0.8, -0.8, -0.6]]
-}
\ No newline at end of file
+}
+
+
+def buildSquareScores():
+    """
+    Fold material and positional score into one signed flat table per piece
+    """
+    tables = {}
+    for piece, rows in piecePositionScores.items():
+        sign = 1 if piece[0] == 'w' else -1
+        value = pieceScore[piece[1]]
+        if piece[1] == "K":  # No position table for king
+            tables[piece] = [0] * 64
+        else:
+            tables[piece] = [sign * (value + rows[r][c] * .1) for r in range(8) for c in range(8)]
+    return tables
+
+# Signed score per piece indexed by row * 8 + col
+squareScores = buildSquareScores()
@@ -35,6 +35,30 @@ class GameState:
         self.castleRightsLog = [CastleRights(self.currentCastlingRights.wks, self.currentCastlingRights.bks,
                                            self.currentCastlingRights.wqs, self.currentCastlingRights.bqs)]
 
+    '''
+    Capture the position as immutable values (flat board tuple, side to move, kings, en passant, castling)
+    '''
+
+    def snapshot(self):
+        rights = self.currentCastlingRights
+        return (tuple(square for row in self.board for square in row), self.whiteToMove,
+                self.whiteKingLocation, self.blackKingLocation, self.enpassantPossible,
+                (rights.wks, rights.bks, rights.wqs, rights.bqs))
+
+    '''
+    Load a position taken with snapshot(); the move log starts empty, so only moves made afterwards can be undone
+    '''
+
+    def restore(self, snap):
+        flat, self.whiteToMove, self.whiteKingLocation, self.blackKingLocation, self.enpassantPossible, castle = snap
+        self.board = [list(flat[i:i + 8]) for i in range(0, 64, 8)]
+        self.moveLog = []
+        self.checkmate = False
+        self.stalemate = False
+        self.enpassantPossibleLog = [self.enpassantPossible]
+        self.currentCastlingRights = CastleRights(*castle)
+        self.castleRightsLog = [CastleRights(*castle)]
+
     '''
     Takes a Move as a parameter and executes it (this will not work for castling, pawn promotion, and en-passant)
     '''
@@ -181,7 +205,7 @@ class GameState:
             # 4.) for each of your opponent's moves, see if they attack your king
             self.whiteToMove = not self.whiteToMove
             if self.inCheck():
-                moves.remove(moves[i])  # 5.) if they do attack your king, not a valid move
+                del moves[i]  # 5.) if they do attack your king, not a valid move
             self.whiteToMove = not self.whiteToMove
             self.undoMove()
         if len(moves) == 0:  # either checkmate or stalemate
@@ -212,12 +236,28 @@ class GameState:
     '''
 
     def squareUnderAttack(self, r, c):
-        self.whiteToMove = not self.whiteToMove  # switch to opponent's turn
-        oppMoves = self.getAllPossibleMoves()
-        self.whiteToMove = not self.whiteToMove  # switch turns back
-        for move in oppMoves:
-            if move.endRow == r and move.endCol == c:  # square is under attack
+        board = self.board
+        knight, king, pawn, rookSliders, bishopSliders = ENEMY_ATTACKERS[self.whiteToMove]
+        # look outwards from the square instead of generating every opponent move
+        for endRow, endCol in KNIGHT_TARGETS[r][c]:
+            if board[endRow][endCol] == knight:
+                return True
+        for endRow, endCol in KING_TARGETS[r][c]:
+            if board[endRow][endCol] == king:
                 return True
+        pawnRow = r - 1 if self.whiteToMove else r + 1  # enemy pawns attack towards this square
+        if 0 <= pawnRow < 8:
+            for pawnCol in (c - 1, c + 1):
+                if 0 <= pawnCol < 8 and board[pawnRow][pawnCol] == pawn:
+                    return True
+        for ray, sliders in ((ROOK_RAYS[r][c], rookSliders), (BISHOP_RAYS[r][c], bishopSliders)):
+            for squares in ray:
+                for endRow, endCol in squares:
+                    endPiece = board[endRow][endCol]
+                    if endPiece != "--":
+                        if endPiece in sliders:
+                            return True
+                        break
         return False
 
     '''
@@ -226,12 +266,12 @@ class GameState:
 
     def getAllPossibleMoves(self):
         moves = []
-        for r in range(len(self.board)):  # number of rows
-            for c in range(len(self.board[r])):  # number of cols in given row
-                turn = self.board[r][c][0]
-                if (turn == 'w' and self.whiteToMove) or (turn == 'b' and not self.whiteToMove):
-                    piece = self.board[r][c][1]
-                    self.moveFunctions[piece](r, c, moves)  # calls the appropriate move function based on piece type
+        allyColor = "w" if self.whiteToMove else "b"
+        moveFunctions = self.moveFunctions
+        for r, row in enumerate(self.board):  # number of rows
+            for c, square in enumerate(row):  # number of cols in given row
+                if square[0] == allyColor:
+                    moveFunctions[square[1]](r, c, moves)  # calls the appropriate move function based on piece type
         return moves
 
     '''
@@ -379,6 +419,28 @@ class GameState:
                 moves.append(Move((r, c), (r, c - 2), self.board, isCastleMove=True))
 
 
+def _buildTargets(offsets):
+    return [[tuple((r + dr, c + dc) for dr, dc in offsets if 0 <= r + dr < 8 and 0 <= c + dc < 8)
+             for c in range(8)] for r in range(8)]
+
+
+def _buildRays(directions):
+    return [[tuple(tuple((r + dr * i, c + dc * i) for i in range(1, 8)
+                         if 0 <= r + dr * i < 8 and 0 <= c + dc * i < 8) for dr, dc in directions)
+             for c in range(8)] for r in range(8)]
+
+
+# Precomputed per-square targets used by squareUnderAttack
+KNIGHT_TARGETS = _buildTargets(((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)))
+KING_TARGETS = _buildTargets(((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)))
+ROOK_RAYS = _buildRays(((-1, 0), (0, -1), (1, 0), (0, 1)))
+BISHOP_RAYS = _buildRays(((-1, -1), (-1, 1), (1, -1), (1, 1)))
+
+# Enemy piece codes for squareUnderAttack keyed by whiteToMove: knight, king, pawn, rook-line and bishop-line sliders
+ENEMY_ATTACKERS = {True: ("bN", "bK", "bp", ("bR", "bQ"), ("bB", "bQ")),
+                   False: ("wN", "wK", "wp", ("wR", "wQ"), ("wB", "wQ"))}
+
+
 class CastleRights:
     def __init__(self, wks, bks, wqs, bqs):
         self.wks = wks
@@ -6,7 +6,9 @@ This replaces the basic opening_principles_state.py with more features
 
 import pygame
 import chess
+import chess.polyglot
 import random
+import bisect
 from src.core.state_machine import BaseState, GameState
 from src.chess.chess_board import ChessBoard
 from src.ui.components import Button, ProgressBar, AnimatedText
@@ -17,18 +19,75 @@ from .parts.game_analyzer import GameAnalyzer
 from .parts.opening_exercises import OpeningExercises
 import math
 import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Posted by the evaluation worker once the game's player moves have been scored
+EVAL_DONE = pygame.USEREVENT + 8
+
+# Feedback colors
+COLOR_GREAT = (100, 255, 100)
+COLOR_GOOD = (200, 255, 200)
+COLOR_OK = (255, 255, 200)
+COLOR_BAD = (255, 200, 200)
+COLOR_WARN = (255, 200, 100)
+COLOR_LOSS = (255, 100, 100)
+COLOR_DRAW = (255, 255, 100)
+
+# Move coaching tiers: bisect_right(_COACHING_THRESHOLDS, score) indexes _COACHING_TIERS
+_COACHING_THRESHOLDS = (0.4, 0.6, 0.8)
+_COACHING_TIERS = (
+    (("Hmm, reconsider.", "Check opening principles.", "Better moves available."), COLOR_BAD),
+    (("Acceptable.", "Consider the principles.", "Room for improvement."), COLOR_OK),
+    (("Good move!", "Solid choice.", "Nice development!"), COLOR_GOOD),
+    (("Excellent!", "Perfect opening move!", "Great principle application!"), COLOR_GREAT)
+)
+
+# Active feedback overlay; None when no feedback is shown
+FeedbackState = namedtuple('FeedbackState', 'message timer color')
+
+_CENTER_SQUARES = frozenset((chess.D4, chess.E4, chess.D5, chess.E5))
+
 class OpeningPrinciplesState(BaseState):
     """Complete Opening Principles & First Game Module"""
     
+    # Fixed attribute layout; every attribute the state assigns must be listed
+    __slots__ = (
+        # Module flow
+        'module_phases', 'current_phase', 'current_phase_index',
+        'current_principle_index', 'current_principle_icon', 'current_exercise',
+        'current_opening_index', 'selected_answer', 'opening_principles',
+        '_opening_cache',
+        # Components
+        'exercises', 'opening_analyzer', 'first_game_engine', 'game_analyzer',
+        'chess_board', '_eval_pool', '_analysis_cache', '_evaluation_cache',
+        '_pending_evals', '_eval_future', '_game_generation', '_analysis_pending',
+        # Game state
+        'game_board', 'game_moves', 'ply_count', 'move_evaluations', 'is_player_turn',
+        'selected_square', 'legal_moves', '_moves_by_target', 'game_analysis',
+        # Progress tracking
+        'phase_scores', 'total_score', 'exercises_completed', 'correct_answers',
+        'total_attempts', 'principle_mastery',
+        # UI state
+        'feedback',
+        'show_hints', 'hint_text', 'animated_texts', 'particle_effects',
+        'session_timer', 'phase_timer',
+        # Fonts
+        'title_font', 'subtitle_font', 'text_font', 'small_font', 'icon_font',
+        # Widgets
+        'back_button', 'phase_progress_bar', 'next_button', 'hint_button',
+        'answer_buttons', 'resign_button', 'analyze_button'
+    )
+    
     def __init__(self, engine):
         try:
             super().__init__(engine)
             
             # Initialize exercise system
             self.exercises = OpeningExercises()
+            self._opening_cache = self._build_opening_cache()
             
             # Module phases
             self.module_phases = [
@@ -100,6 +159,18 @@ class OpeningPrinciplesState(BaseState):
             
             # Initialize components
             self.opening_analyzer = OpeningAnalyzer(self.opening_principles)
+            self._eval_pool = ThreadPoolExecutor(max_workers=1)
+            
+            # Analysis results keyed by (Zobrist hash, ply), evaluations by (hash, uci, ply); cleared per game
+            self._analysis_cache = {}
+            self._evaluation_cache = {}
+            
+            # Player moves awaiting analyzer evaluation at game end; the batch job is
+            # stamped with the game it belongs to so a stale result is never applied
+            self._pending_evals = []
+            self._eval_future = None
+            self._game_generation = 0
+            self._analysis_pending = False  # analysis waits for the batch's EVAL_DONE
             self.first_game_engine = FirstGameEngine(self.config)
             self.game_analyzer = GameAnalyzer()
             
@@ -115,10 +186,12 @@ class OpeningPrinciplesState(BaseState):
             # Game state
             self.game_board = chess.Board()
             self.game_moves = []
+            self.ply_count = 0
             self.move_evaluations = []
             self.is_player_turn = True
             self.selected_square = None
             self.legal_moves = []
+            self._moves_by_target = [None] * 64  # target square -> legal move of the selection
             
             # Progress tracking
             self.phase_scores = {}
@@ -129,10 +202,7 @@ class OpeningPrinciplesState(BaseState):
             self.principle_mastery = {key: 0 for key in self.opening_principles}
             
             # UI state
-            self.show_feedback = False
-            self.feedback_message = ""
-            self.feedback_timer = 0
-            self.feedback_color = None
+            self.feedback = None
             self.show_hints = False
             self.hint_text = ""
             
@@ -259,7 +329,7 @@ class OpeningPrinciplesState(BaseState):
         """Initialize a new phase"""
         self.current_phase = phase_name
         self.phase_timer.reset()
-        self.show_feedback = False
+        self.feedback = None
         self.animated_texts.clear()
         
         # Phase-specific initialization
@@ -365,15 +435,15 @@ class OpeningPrinciplesState(BaseState):
                 (400, 100),
                 size=28,
                 duration=3.0,
-                color=(255, 100, 100)
+                color=COLOR_LOSS
             )
     
     def start_repertoire(self):
         """Learn opening sequences"""
-        openings = list(self.exercises.opening_sequences.values())
+        openings = list(self.exercises.opening_sequences.items())
         
         if self.current_opening_index < len(openings):
-            opening = openings[self.current_opening_index]
+            opening_key, opening = openings[self.current_opening_index]
             
             # Show opening name
             self.create_animated_text(
@@ -393,7 +463,7 @@ class OpeningPrinciplesState(BaseState):
             )
             
             # Demonstrate moves
-            self.demonstrate_opening(opening['moves'])
+            self.demonstrate_opening(opening_key)
     
     def start_pre_game(self):
         """Pre-game coaching"""
@@ -402,7 +472,7 @@ class OpeningPrinciplesState(BaseState):
             (400, 100),
             size=32,
             duration=4.0,
-            color=(100, 255, 100)
+            color=COLOR_GREAT
         )
         
         tips = [
@@ -428,7 +498,14 @@ class OpeningPrinciplesState(BaseState):
         self.game_board.reset()
         self.chess_board.set_board(self.game_board)
         self.game_moves.clear()
+        self.ply_count = 0
         self.move_evaluations.clear()
+        self._pending_evals.clear()
+        self._eval_future = None
+        self._game_generation += 1
+        self._analysis_pending = False
+        self._analysis_cache.clear()
+        self._evaluation_cache.clear()
         self.is_player_turn = True
         
         self.first_game_engine.start_new_game()
@@ -442,6 +519,22 @@ class OpeningPrinciplesState(BaseState):
     
     def start_analysis(self):
         """Analyze the completed game"""
+        # The analysis needs every move evaluation; if the batch is still running,
+        # the EVAL_DONE handler runs it instead of the frame loop waiting here
+        if self._eval_future is not None:
+            self._analysis_pending = True
+            self.create_animated_text(
+                "Analyzing your moves...",
+                (400, 100),
+                size=28,
+                duration=2.0
+            )
+            return
+        
+        self.analyze_completed_game()
+    
+    def analyze_completed_game(self):
+        """Run the game analyzer over the finished game and show the summary"""
         if self.game_moves:
             analysis = self.game_analyzer.analyze_game(
                 self.game_moves,
@@ -499,7 +592,7 @@ class OpeningPrinciplesState(BaseState):
                 size=22,
                 duration=6.0,
                 delay=2.0 + i * 0.5,
-                color=(255, 200, 100)
+                color=COLOR_WARN
             )
     
     def update(self, dt):
@@ -507,10 +600,10 @@ class OpeningPrinciplesState(BaseState):
         super().update(dt)
         
         # Update timers
-        if self.show_feedback:
-            self.feedback_timer -= dt
-            if self.feedback_timer <= 0:
-                self.show_feedback = False
+        feedback = self.feedback
+        if feedback is not None:
+            timer = feedback.timer - dt
+            self.feedback = feedback._replace(timer=timer) if timer > 0 else None
         
         # Update animations
         for text in self.animated_texts[:]:
@@ -579,7 +672,7 @@ class OpeningPrinciplesState(BaseState):
             particle.render(screen)
         
         # Draw feedback
-        if self.show_feedback:
+        if self.feedback is not None:
             self.render_feedback(screen)
         
         # Draw hints
@@ -657,7 +750,7 @@ class OpeningPrinciplesState(BaseState):
         """Render the game phase"""
         # Show turn indicator
         turn_text = "Your Turn" if self.is_player_turn else "Opponent's Turn"
-        turn_color = (100, 255, 100) if self.is_player_turn else (255, 200, 100)
+        turn_color = COLOR_GREAT if self.is_player_turn else COLOR_WARN
         turn_surface = self.subtitle_font.render(turn_text, True, turn_color)
         screen.blit(turn_surface, (550, 150))
         
@@ -667,7 +760,7 @@ class OpeningPrinciplesState(BaseState):
         screen.blit(moves_title, (550, move_list_y))
         
         for i, move in enumerate(self.game_moves[-8:]):
-            move_num = i + len(self.game_moves) - min(8, len(self.game_moves)) + 1
+            move_num = i + self.ply_count - min(8, self.ply_count) + 1
             move_text = f"{move_num}. {move}"
             move_surface = self.small_font.render(move_text, True, self.config.COLORS['text_light'])
             screen.blit(move_surface, (550, move_list_y + 30 + i * 20))
@@ -678,7 +771,7 @@ class OpeningPrinciplesState(BaseState):
             # Show strengths
             y_offset = 200
             if self.game_analysis.get('strengths'):
-                strength_title = self.text_font.render("Strengths:", True, (100, 255, 100))
+                strength_title = self.text_font.render("Strengths:", True, COLOR_GREAT)
                 screen.blit(strength_title, (550, y_offset))
                 y_offset += 30
                 
@@ -715,7 +808,8 @@ class OpeningPrinciplesState(BaseState):
     
     def render_feedback(self, screen):
         """Render feedback overlay"""
-        if self.feedback_message:
+        feedback = self.feedback
+        if feedback.message:
             # Create overlay
             overlay = pygame.Surface((500, 100))
             overlay.set_alpha(220)
@@ -726,9 +820,9 @@ class OpeningPrinciplesState(BaseState):
             screen.blit(overlay, (x, y))
             
             # Draw message
-            color = self.feedback_color or self.config.COLORS['success']
+            color = feedback.color or self.config.COLORS['success']
             feedback_surface = self.subtitle_font.render(
-                self.feedback_message,
+                feedback.message,
                 True,
                 color
             )
@@ -793,7 +887,7 @@ class OpeningPrinciplesState(BaseState):
             achievements.append("Principle Student")
         if self.correct_answers >= self.total_attempts * 0.8:
             achievements.append("Quick Learner")
-        if len(self.game_moves) >= 30:
+        if self.ply_count >= 30:
             achievements.append("Endurance Fighter")
         if hasattr(self, 'game_analysis'):
             if self.game_analysis.get('opening_score', 0) >= 80:
@@ -806,6 +900,16 @@ class OpeningPrinciplesState(BaseState):
     # Event handlers
     def handle_event(self, event):
         """Handle input events"""
+        if event.type == EVAL_DONE:
+            # Results from an earlier game, or already applied, are dropped
+            if event.generation == self._game_generation and self._eval_future is not None:
+                self._apply_evaluations(event.evaluations)
+                if self._analysis_pending:
+                    self._analysis_pending = False
+                    if self.current_phase == 'post_game_analysis':
+                        self.analyze_completed_game()
+            return
+        
         self.back_button.handle_event(event)
         self.hint_button.handle_event(event)
         
@@ -839,6 +943,11 @@ class OpeningPrinciplesState(BaseState):
                         move for move in self.game_board.legal_moves
                         if move.from_square == square
                     ]
+                    moves_by_target = self._moves_by_target
+                    for move in self.legal_moves:
+                        # Keep the first (queen) promotion when several share a target
+                        if moves_by_target[move.to_square] is None:
+                            moves_by_target[move.to_square] = move
                     self.highlight_legal_moves()
             else:
                 # Try to move
@@ -848,25 +957,23 @@ class OpeningPrinciplesState(BaseState):
                     self.is_player_turn = False
                 
                 # Clear selection
+                for legal_move in self.legal_moves:
+                    self._moves_by_target[legal_move.to_square] = None
                 self.selected_square = None
                 self.legal_moves = []
                 self.chess_board.clear_highlights()
     
     def get_move_to_square(self, square):
         """Get legal move to target square"""
-        for move in self.legal_moves:
-            if move.to_square == square:
-                return move
-        return None
+        return self._moves_by_target[square]
     
     def highlight_legal_moves(self):
         """Highlight legal move squares"""
         self.chess_board.clear_highlights()
+        highlight = self.chess_board.highlight_square
+        highlight_color = self.config.COLORS['highlight']
         for move in self.legal_moves:
-            self.chess_board.highlight_square(
-                move.to_square,
-                self.config.COLORS['highlight']
-            )
+            highlight(move.to_square, highlight_color)
     
     def make_move(self, move):
         """Execute a move"""
@@ -874,20 +981,22 @@ class OpeningPrinciplesState(BaseState):
             # Record move
             san = self.game_board.san(move)
             self.game_moves.append(san)
+            self.ply_count += 1
+            if self.is_player_turn:
+                # The analyzer scores by ply too, so the same move at another ply is a different entry
+                evaluation_key = (chess.polyglot.zobrist_hash(self.game_board), move.uci(), self.ply_count)
+                quick_evaluation = self._quick_evaluation(move)
             
             # Make move
             self.game_board.push(move)
             self.chess_board.set_board(self.game_board)
             
-            # Evaluate if player move
+            # Coach player moves now, queue the full evaluation for game end
             if self.is_player_turn:
-                evaluation = self.opening_analyzer.evaluate_move(
-                    self.game_board,
-                    move,
-                    len(self.game_moves)
+                self._pending_evals.append(
+                    (evaluation_key, self._snapshot(), move, self.ply_count)
                 )
-                self.move_evaluations.append(evaluation)
-                self.provide_move_coaching(evaluation)
+                self.provide_move_coaching(quick_evaluation)
             
             # Check game end
             if self.game_board.is_game_over():
@@ -902,22 +1011,71 @@ class OpeningPrinciplesState(BaseState):
         except Exception as e:
             logger.error(f"Move error: {e}")
     
+    def _quick_evaluation(self, move):
+        """Cheap principle-based score for a move, checked before it is pushed"""
+        board = self.game_board
+        piece_type = board.piece_type_at(move.from_square)
+        score = 0.5
+        
+        if board.is_castling(move):
+            score += 0.4
+        elif piece_type in (chess.KNIGHT, chess.BISHOP) and chess.square_rank(move.from_square) == 0:
+            score += 0.3
+        elif piece_type == chess.PAWN and move.to_square in _CENTER_SQUARES:
+            score += 0.3
+        elif piece_type == chess.QUEEN and self.ply_count <= 10:
+            score -= 0.2
+        
+        return {'score': min(max(score, 0.0), 1.0)}
+    
+    def evaluate_pending_moves(self):
+        """Evaluate all queued player moves in one worker job"""
+        if not self._pending_evals:
+            return
+        
+        pending = self._pending_evals
+        self._pending_evals = []
+        future = self._eval_pool.submit(self._evaluate_batch, pending)
+        future.generation = self._game_generation
+        self._eval_future = future
+        future.add_done_callback(self._on_evaluation_done)
+    
+    def _evaluate_batch(self, pending):
+        """Run the analyzer over queued moves (worker thread)"""
+        evaluations = []
+        for key, snapshot, move, ply in pending:
+            evaluation = self._evaluation_cache.get(key)
+            if evaluation is None:
+                evaluation = self.opening_analyzer.evaluate_move(
+                    self._board_from_snapshot(snapshot),
+                    move,
+                    ply
+                )
+                self._evaluation_cache[key] = evaluation
+            evaluations.append(evaluation)
+        return evaluations
+    
+    def _on_evaluation_done(self, future):
+        """Post finished move evaluations back to the main loop"""
+        try:
+            evaluations = future.result()
+        except Exception as e:
+            # Still post, so an analysis waiting on this batch runs with what it has
+            logger.error(f"Move evaluation error: {e}")
+            evaluations = []
+        pygame.event.post(
+            pygame.event.Event(EVAL_DONE, evaluations=evaluations, generation=future.generation)
+        )
+    
+    def _apply_evaluations(self, evaluations):
+        """Add the finished batch to this game's evaluations, exactly once"""
+        self.move_evaluations.extend(evaluations)
+        self._eval_future = None
+    
     def provide_move_coaching(self, evaluation):
         """Provide coaching feedback on moves"""
         score = evaluation.get('score', 0.5)
-        
-        if score >= 0.8:
-            messages = ["Excellent!", "Perfect opening move!", "Great principle application!"]
-            color = (100, 255, 100)
-        elif score >= 0.6:
-            messages = ["Good move!", "Solid choice.", "Nice development!"]
-            color = (200, 255, 200)
-        elif score >= 0.4:
-            messages = ["Acceptable.", "Consider the principles.", "Room for improvement."]
-            color = (255, 255, 200)
-        else:
-            messages = ["Hmm, reconsider.", "Check opening principles.", "Better moves available."]
-            color = (255, 200, 200)
+        messages, color = _COACHING_TIERS[bisect.bisect_right(_COACHING_THRESHOLDS, score)]
         
         self.show_feedback_message(
             random.choice(messages),
@@ -931,25 +1089,25 @@ class OpeningPrinciplesState(BaseState):
         
         if "1-0" in result:
             message = "Victory! Well played!"
-            color = (100, 255, 100)
+            color = COLOR_GREAT
         elif "0-1" in result:
             message = "Defeat, but you learned!"
-            color = (255, 100, 100)
+            color = COLOR_LOSS
         else:
             message = "Draw! Good fight!"
-            color = (255, 255, 100)
+            color = COLOR_DRAW
         
         self.show_feedback_message(message, duration=4.0, color=color)
         
+        # Full evaluations are needed by the post-game analysis
+        self.evaluate_pending_moves()
+        
         # Move to analysis after delay
         pygame.time.set_timer(pygame.USEREVENT + 1, 4000)
     
     def show_feedback_message(self, message, duration=2.0, color=None):
         """Display feedback message"""
-        self.feedback_message = message
-        self.feedback_timer = duration
-        self.feedback_color = color
-        self.show_feedback = True
+        self.feedback = FeedbackState(message, duration, color)
     
     # Navigation
     def next_phase(self):
@@ -980,7 +1138,7 @@ class OpeningPrinciplesState(BaseState):
             self.total_attempts += 1
             if correct:
                 self.correct_answers += 1
-                self.show_feedback_message("Correct! Well done!", color=(100, 255, 100))
+                self.show_feedback_message("Correct! Well done!", color=COLOR_GREAT)
                 
                 # Update principle mastery
                 principle = self.current_exercise.get('principle')
@@ -993,7 +1151,7 @@ class OpeningPrinciplesState(BaseState):
                 self.show_feedback_message(
                     f"Not quite. {self.current_exercise.get('explanation', '')}",
                     duration=3.0,
-                    color=(255, 200, 100)
+                    color=COLOR_WARN
                 )
             
             # Next exercise after delay
@@ -1006,15 +1164,28 @@ class OpeningPrinciplesState(BaseState):
         if self.show_hints and self.current_exercise:
             self.hint_text = self.current_exercise.get('hint', 'Think about the opening principles!')
     
-    def demonstrate_opening(self, moves):
+    def _build_opening_cache(self):
+        """Parse every opening sequence once, keeping its legal prefix"""
+        cache = {}
+        for opening_key, opening in self.exercises.opening_sequences.items():
+            board = chess.Board()
+            moves = []
+            for move_san in opening['moves']:
+                try:
+                    move = board.parse_san(move_san)
+                except ValueError:
+                    logger.warning(f"Opening '{opening_key}' stops at illegal move {move_san}")
+                    break
+                board.push(move)
+                moves.append(move)
+            cache[opening_key] = moves
+        return cache
+    
+    def demonstrate_opening(self, opening_key):
         """Demonstrate an opening sequence"""
         self.game_board.reset()
-        for move_san in moves:
-            try:
-                move = self.game_board.parse_san(move_san)
-                self.game_board.push(move)
-            except:
-                break
+        for move in self._opening_cache[opening_key]:
+            self.game_board.push(move)
         
         self.chess_board.set_board(self.game_board)
     
@@ -1023,16 +1194,50 @@ class OpeningPrinciplesState(BaseState):
         self.show_feedback_message("Game resigned. Let's analyze!", duration=3.0)
         self.handle_game_end()
     
+    def _snapshot(self):
+        """Minimal immutable view of the current position for analyzers"""
+        board = self.game_board
+        return (
+            board.board_fen(),
+            board.turn,
+            board.castling_rights,
+            board.ep_square,
+            board.halfmove_clock,
+            board.fullmove_number
+        )
+    
+    @staticmethod
+    def _board_from_snapshot(snapshot):
+        """Rebuild a stack-less board from a position snapshot"""
+        board_fen, turn, castling_rights, ep_square, halfmove_clock, fullmove_number = snapshot
+        board = chess.Board(None)
+        board.set_board_fen(board_fen)
+        board.turn = turn
+        board.castling_rights = castling_rights
+        board.ep_square = ep_square
+        board.halfmove_clock = halfmove_clock
+        board.fullmove_number = fullmove_number
+        return board
+    
     def analyze_position(self):
         """Quick position analysis"""
-        analysis = self.opening_analyzer.analyze_position(
-            self.game_board,
-            len(self.game_moves)
-        )
+        # The analyzer scores by ply too, so the ply is part of the key
+        key = (chess.polyglot.zobrist_hash(self.game_board), self.ply_count)
+        analysis = self._analysis_cache.get(key)
+        if analysis is None:
+            analysis = self.opening_analyzer.analyze_position(
+                self._board_from_snapshot(self._snapshot()),
+                self.ply_count
+            )
+            self._analysis_cache[key] = analysis
         
         message = f"Position: {analysis.get('evaluation', 'Equal')}"
         self.show_feedback_message(message, duration=3.0)
     
     def on_back_clicked(self):
         """Return to main menu"""
-        self.engine.change_state(GameState.MAIN_MENU)
\ No newline at end of file
+        self.engine.change_state(GameState.MAIN_MENU)
+    
+    def cleanup(self):
+        """Release the move evaluation worker"""
+        self._eval_pool.shutdown(wait=False)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # src/states/pawn_movement_state.py
 
 import pygame
+import pygame.gfxdraw
 import chess
 import random
 from src.core.state_machine import BaseState, GameState
@@ -9,106 +10,263 @@ from src.ui.components import Button, ProgressBar, AnimatedText
 from src.utils.timer import Timer
 import math
 import logging
+import numpy as np
+
+# Numba is optional; without it particles are integrated with NumPy ufuncs
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Shared piece instances used when placing exercises
+_WHITE_PAWN = chess.Piece(chess.PAWN, chess.WHITE)
+_BLACK_PAWN = chess.Piece(chess.PAWN, chess.BLACK)
+_BLACK_KNIGHT = chess.Piece(chess.KNIGHT, chess.BLACK)
+_BLACK_BISHOP = chess.Piece(chess.BISHOP, chess.BLACK)
+_BLACK_ROOK = chess.Piece(chess.ROOK, chess.BLACK)
+_BLACK_QUEEN = chess.Piece(chess.QUEEN, chess.BLACK)
+
+_TWO_PI = 2 * math.pi
+
+# Initial capacity of the celebration particle arrays; they double when a burst does not fit
+_PARTICLE_CAPACITY = 128
+_GRAVITY = 500.0
+
+# Number of reusable "+points" texts kept ready
+_ANIMTEXT_POOL_SIZE = 8
+# Rendered text surfaces kept before the cache is flushed
+_TEXT_CACHE_LIMIT = 128
+
+# Fonts shared by every pawn state instance, keyed by point size
+_FONT_CACHE = {}
+
+
+def _get_font(size):
+    """Return a cached default font of the given size"""
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        try:
+            font = pygame.font.Font(None, size)
+        except Exception as e:
+            logger.error(f"Failed to load font: {e}")
+            # Fallback to system font
+            font = pygame.font.SysFont('Arial', size)
+        _FONT_CACHE[size] = font
+    return font
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _step_particles(pos, vel, dt, gravity):
+        """Integrate particle positions and gravity in place"""
+        for i in range(pos.shape[0]):
+            pos[i, 0] += vel[i, 0] * dt
+            pos[i, 1] += vel[i, 1] * dt
+            vel[i, 1] += gravity * dt
+else:
+    _step_particles = None
+
+
+def _squares_mask(squares):
+    """Combine a list of squares into a bitboard"""
+    mask = chess.BB_EMPTY
+    for square in squares:
+        mask |= chess.BB_SQUARES[square]
+    return mask
+
+
+# White pawn move targets per square, -1 where the move leaves the board
+_PAWN_FORWARD = [sq + 8 if sq + 8 <= 63 else -1 for sq in range(64)]
+_PAWN_DBL = [sq + 16 if chess.square_rank(sq) == 1 else -1 for sq in range(64)]
+_PAWN_CAP_L = [sq + 7 if chess.square_file(sq) > 0 and chess.square_rank(sq) < 7 else -1 for sq in range(64)]
+_PAWN_CAP_R = [sq + 9 if chess.square_file(sq) < 7 and chess.square_rank(sq) < 7 else -1 for sq in range(64)]
+
+
+# Squares (relative to the pawn) that are wrong answers for each exercise type
+_INVALID_OFFSETS = {
+    'basic_forward': (-8, +1, -1),      # Backward and sideways
+    'initial_double': (+24, +7, +9),    # Three forward and empty diagonals
+    'capture': (+8,),                   # Forward is not a capture
+    'blocked': (+8,),                   # The blocked square itself
+    'en_passant_setup': (),
+}
+
+
+def _materialize_offsets(pawn_square, pawn_file, offsets):
+    """Turn relative offsets into on-board squares that stay on adjacent files"""
+    return [sq for off in offsets
+            if 0 <= (sq := pawn_square + off) <= 63 and abs((sq & 7) - pawn_file) <= 1]
+
 class PawnMovementState(BaseState):
     """Module for teaching pawn movement and capture rules"""
     
+    # Only these event types do anything in this state; buttons track hover in update()
+    _INTERESTING_EVENTS = frozenset((pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN))
+    # Event types dropped from the queue entirely while the module is active
+    _BLOCKED_EVENTS = (pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+                       pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP)
+    
     def __init__(self, engine):
+        super().__init__(engine)
+        
+        # Module configuration
+        self.exercises_per_type = 3  # Exercises for each movement type
+        self.movement_types = [
+            'basic_forward',      # Single square forward
+            'initial_double',     # Two squares from starting position
+            'capture',           # Diagonal capture
+            'blocked',           # Understanding when pawns are blocked
+            'en_passant_setup'   # Basic en passant scenarios (advanced)
+        ]
+        
+        # Progress tracking
+        self.current_exercise = 0
+        self.current_type_index = 0
+        self.correct_moves = 0
+        self.total_attempts = 0
+        self.exercises_completed = {}
+        for move_type in self.movement_types:
+            self.exercises_completed[move_type] = 0
+        self._total_completed = 0  # Running sum of exercises_completed
+        self._max_exercises = len(self.movement_types) * self.exercises_per_type
+        
+        # Current exercise data
+        self.current_pawn_square = None
+        self.target_squares = []  # Valid move squares
+        self.invalid_squares = []  # Squares that look valid but aren't
+        self.target_mask = 0  # Bitboards of the two lists above
+        self.invalid_mask = 0
+        self.selected_square = None
+        self.show_feedback = False
+        self.feedback_message = ""
+        self._feedback_is_correct = False  # Picks the feedback colour
+        self.exercise_type = None
+        self.show_hint = False
+        
+        # Exercise generator for each movement type
+        self._generators = {
+            'basic_forward': self._generate_basic_forward,
+            'initial_double': self._generate_initial_double,
+            'capture': self._generate_capture,
+            'blocked': self._generate_blocked,
+            'en_passant_setup': self._generate_en_passant
+        }
+        
+        # Pre-generated exercises per movement type
+        self._exercise_pool = {move_type: [] for move_type in self.movement_types}
+        # Squares holding pieces from the current exercise
+        self._last_placed = []
+        # Pre-sampled random bits for coin flips in exercise generation
+        self._rng_bits = 0
+        self._rng_bits_left = 0
+        # Board squares + pieces, re-rendered only when pieces change
+        self._static_board_surface = None
+        
+        # Chess board
         try:
-            super().__init__(engine)
-            
-            # Module configuration
-            self.exercises_per_type = 3  # Exercises for each movement type
-            self.movement_types = [
-                'basic_forward',      # Single square forward
-                'initial_double',     # Two squares from starting position
-                'capture',           # Diagonal capture
-                'blocked',           # Understanding when pawns are blocked
-                'en_passant_setup'   # Basic en passant scenarios (advanced)
-            ]
-            
-            # Progress tracking
-            self.current_exercise = 0
-            self.current_type_index = 0
-            self.correct_moves = 0
-            self.total_attempts = 0
-            self.exercises_completed = {}
-            for move_type in self.movement_types:
-                self.exercises_completed[move_type] = 0
-            
-            # Current exercise data
-            self.current_pawn_square = None
-            self.target_squares = []  # Valid move squares
-            self.invalid_squares = []  # Squares that look valid but aren't
-            self.selected_square = None
-            self.show_feedback = False
-            self.feedback_timer = 0
-            self.feedback_message = ""
-            self.exercise_type = None
-            self.show_hint = False
-            
-            # Chess board
-            try:
-                self.chess_board = ChessBoard(
-                    self.engine.screen,
-                    self.engine.resource_manager,
-                    board_size=480
-                )
-                # Center the board
-                self.chess_board.board_offset_x = (self.config.SCREEN_WIDTH - 480) // 2
-                self.chess_board.board_offset_y = 180
-            except Exception as e:
-                logger.error(f"Failed to initialize chess board: {e}")
-                raise
-            
-            # UI elements
-            self.create_ui_elements()
-            
-            # Instructions for each movement type
-            self.instructions = {
-                'basic_forward': "Pawns move forward one square. Click where this pawn can move.",
-                'initial_double': "Pawns can move two squares forward from their starting position.",
-                'capture': "Pawns capture diagonally forward. Click where this pawn can capture.",
-                'blocked': "Pawns cannot move if blocked. Can this pawn move?",
-                'en_passant_setup': "Special move: En passant capture. Can you find it?"
-            }
-            
-            # Load fonts
-            try:
-                self.title_font = pygame.font.Font(None, 48)
-                self.instruction_font = pygame.font.Font(None, 32)
-                self.info_font = pygame.font.Font(None, 24)
-            except Exception as e:
-                logger.error(f"Failed to load fonts: {e}")
-                # Fallback to system font
-                self.title_font = pygame.font.SysFont('Arial', 48)
-                self.instruction_font = pygame.font.SysFont('Arial', 32)
-                self.info_font = pygame.font.SysFont('Arial', 24)
-            
-            # Animation elements
-            self.animated_texts = []
-            self.celebration_particles = []
-            self.arrow_animation = 0
-            
-            # Module completion
-            self.module_completed = False
-            self.completion_timer = 0
-            
-            # Session timer
-            self.session_timer = Timer()
-            
+            self.chess_board = ChessBoard(
+                self.engine.screen,
+                self.engine.resource_manager,
+                board_size=480
+            )
+            # Center the board
+            self.chess_board.board_offset_x = (self.config.SCREEN_WIDTH - 480) // 2
+            self.chess_board.board_offset_y = 180
         except Exception as e:
-            logger.error(f"Failed to initialize PawnMovementState: {e}")
+            logger.error(f"Failed to initialize chess board: {e}")
             raise
         
+        # UI elements
+        self.create_ui_elements()
+        
+        # Sound effects, loaded once so playback never decodes on the hot path
+        self._sounds = {}
+        self._preload_sounds()
+        self._active_buttons = []
+        self._last_mouse_pos = (-1, -1)
+        self._refresh_active_buttons()
+        
+        # Instructions for each movement type
+        self.instructions = {
+            'basic_forward': "Pawns move forward one square. Click where this pawn can move.",
+            'initial_double': "Pawns can move two squares forward from their starting position.",
+            'capture': "Pawns capture diagonally forward. Click where this pawn can capture.",
+            'blocked': "Pawns cannot move if blocked. Can this pawn move?",
+            'en_passant_setup': "Special move: En passant capture. Can you find it?"
+        }
+        
+        # Load fonts
+        self.title_font = _get_font(48)
+        self.instruction_font = _get_font(32)
+        self.info_font = _get_font(24)
+        self._success_font = _get_font(72)
+        # Font and message for the render error fallback; the surface is built on first use
+        self._error_font = pygame.font.SysFont('Arial', 24)
+        self._render_error_surface = None
+        
+        # Colours and layout used every frame by render()
+        colors = self.config.COLORS
+        self._c_bg = colors['background']
+        self._c_text = colors['text_dark']
+        self._c_primary = colors['primary']
+        self._c_secondary = colors['secondary']
+        self._c_error = colors.get('error', (255, 0, 0))
+        self._center_x = self.config.SCREEN_WIDTH // 2
+        
+        # Pre-rendered instruction text; other text surfaces are cached on first use
+        text_dark = self.config.COLORS['text_dark']
+        self._instr_surfaces = {
+            move_type: self.info_font.render(text, True, text_dark)
+            for move_type, text in self.instructions.items()
+        }
+        self._text_cache = {}  # (font id, text, color) -> rendered surface
+        self._circle_cache = {}  # (color, radius) -> pre-drawn particle sprite
+        # Last fully drawn frame, reused while nothing on screen changes
+        self._scene_cache = None
+        self._dirty = True
+        
+        # Animation elements
+        self.animated_texts = []
+        # Finished AnimatedText instances waiting for reuse; filled in enter() once the engine exists
+        self._animtext_free = []
+        # Celebration particles as struct-of-arrays; the first _p_count slots are live
+        self._p_count = 0
+        self._p_pos = np.zeros((_PARTICLE_CAPACITY, 2), dtype=np.float32)
+        self._p_vel = np.zeros((_PARTICLE_CAPACITY, 2), dtype=np.float32)
+        self._p_spawn = np.zeros(_PARTICLE_CAPACITY, dtype=np.int64)  # pygame ticks at spawn
+        self._p_life = np.zeros(_PARTICLE_CAPACITY, dtype=np.int64)  # lifetime in ms
+        self._p_size = np.zeros(_PARTICLE_CAPACITY, dtype=np.float32)
+        self._p_color = np.zeros((_PARTICLE_CAPACITY, 3), dtype=np.uint8)
+        self._p_step = np.zeros((_PARTICLE_CAPACITY, 2), dtype=np.float32)  # Scratch for vel * dt
+        self._p_cull_y = self.config.SCREEN_HEIGHT + 50  # Particles below this have fallen off screen
+        # Burst palettes, built once so spawning only writes into the arrays above
+        accent = self.config.COLORS.get('accent', (155, 89, 182))
+        self._celebration_palette = np.array(
+            [accent, self.config.COLORS.get('secondary', (46, 204, 113)), (255, 255, 0)], dtype=np.uint8)
+        self._completion_palette = np.array(
+            [(255, 215, 0), (255, 255, 0), accent], dtype=np.uint8)
+        self.arrow_animation = 0
+        
+        # Module completion
+        self.module_completed = False
+        self._completion_start = 0
+        # Translucent backdrop for the completion screen
+        self._overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        self._overlay.set_alpha(128)
+        self._overlay.fill((0, 0, 0))
+        self._completion_blits = []  # Filled by _enter_completion()
+        
+        # Session timer
+        self.session_timer = Timer()
+        
     def create_ui_elements(self):
         """Create UI elements for the module"""
         try:
             # Progress bar
-            total_exercises = len(self.movement_types) * self.exercises_per_type
+            total_exercises = self._max_exercises
             #self.progress_bar = ProgressBar(
             #    pos=(self.config.SCREEN_WIDTH // 2 - 200, 30),
             #    size=(400, 25),
@@ -154,10 +312,26 @@ class PawnMovementState(BaseState):
             logger.error(f"Failed to create UI elements: {e}")
             raise
         
+    def _preload_sounds(self):
+        """Load the module's sound effects and reserve mixer channels"""
+        try:
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), 16))
+            for name in ('success.mp3', 'error.wav', 'complete.wav'):
+                self._sounds[name] = self.engine.resource_manager.load_sound(name)
+        except Exception as e:
+            logger.warning(f"Failed to preload sounds: {e}")
+            
+    def _play_sound(self, name):
+        """Play a preloaded sound effect if it is available"""
+        sound = self._sounds.get(name)
+        if sound is not None:
+            self.engine.audio_manager.play_loaded_sound(sound)
+            
     def enter(self):
         """Called when entering the pawn movement state"""
         try:
             super().enter()
+            self._dirty = True
             
             # Reset session
             self.current_exercise = 0
@@ -166,11 +340,20 @@ class PawnMovementState(BaseState):
             self.total_attempts = 0
             for move_type in self.movement_types:
                 self.exercises_completed[move_type] = 0
+            self._total_completed = 0
+            self._last_mouse_pos = (-1, -1)
             #self.progress_bar.set_value(0)
             self.module_completed = False
             self.session_timer.reset()
+            pygame.event.set_blocked(self._BLOCKED_EVENTS)
+            
+            # Keep spare animated texts ready for correct-move rewards
+            secondary = self.config.COLORS['secondary']
+            while len(self._animtext_free) < _ANIMTEXT_POOL_SIZE:
+                self._animtext_free.append(AnimatedText("", (0, 0), 48, secondary, 0, self.config))
             
             # Start first exercise
+            self._prebuild_pool()
             self.generate_exercise()
             
             # Play learning music
@@ -184,6 +367,11 @@ class PawnMovementState(BaseState):
             # Return to main menu on critical error
             self.engine.change_state(GameState.MAIN_MENU)
         
+    def exit(self):
+        """Called when leaving the pawn movement state"""
+        super().exit()
+        pygame.event.set_allowed(self._BLOCKED_EVENTS)
+        
     def generate_exercise(self):
         """Generate a new pawn movement exercise"""
         try:
@@ -192,8 +380,10 @@ class PawnMovementState(BaseState):
             self.show_hint = False
             self.target_squares = []
             self.invalid_squares = []
-            self.chess_board.clear_highlights()
+            self.target_mask = 0
+            self.invalid_mask = 0
             self.chess_board.select_square(None)
+            self._refresh_active_buttons()
             
             # Get current exercise type
             if self.current_type_index < len(self.movement_types):
@@ -202,248 +392,234 @@ class PawnMovementState(BaseState):
                 self.complete_module()
                 return
                 
-            # Generate exercise based on type
-            try:
-                if self.exercise_type == 'basic_forward':
-                    self._generate_basic_forward()
-                elif self.exercise_type == 'initial_double':
-                    self._generate_initial_double()
-                elif self.exercise_type == 'capture':
-                    self._generate_capture()
-                elif self.exercise_type == 'blocked':
-                    self._generate_blocked()
-                elif self.exercise_type == 'en_passant_setup':
-                    self._generate_en_passant()
-                else:
-                    logger.warning(f"Unknown exercise type: {self.exercise_type}")
-                    self.next_exercise()
-            except Exception as e:
-                logger.error(f"Failed to generate exercise for type {self.exercise_type}: {e}")
+            # Take the next exercise of this type from the pool
+            exercise = self._take_exercise(self.exercise_type)
+            if exercise is None:
+                logger.warning(f"Unknown exercise type: {self.exercise_type}")
                 self.next_exercise()
+                return
+            self._apply_exercise(exercise)
                 
         except Exception as e:
-            logger.error(f"Failed to generate exercise: {e}")
+            logger.error(f"Failed to generate {self.exercise_type} exercise: {e}")
+            self.chess_board.clear_highlights()
             self.feedback_message = "Error generating exercise. Skipping to next..."
+            self._feedback_is_correct = False
             self.next_exercise()
             
+    def _prebuild_pool(self):
+        """Pre-generate a pool of exercises for every movement type"""
+        # Start from an empty board; exercises then only touch their own squares
+        self.chess_board.board.clear()
+        self.chess_board.clear_highlights()
+        self._last_placed = []
+        self._static_board_surface = None
+        
+        for move_type in self.movement_types:
+            pool = self._exercise_pool[move_type]
+            pool.clear()
+            try:
+                for _ in range(self.exercises_per_type):
+                    exercise = self._build_exercise(move_type)
+                    if exercise is not None:
+                        pool.append(exercise)
+            except Exception as e:
+                # The pool is refilled lazily by _take_exercise
+                logger.warning(f"Failed to pre-generate {move_type} exercises: {e}")
+                
+    def _take_exercise(self, exercise_type):
+        """Pop a pooled exercise, generating one if the pool is empty"""
+        pool = self._exercise_pool.get(exercise_type)
+        if pool:
+            return pool.pop()
+        return self._build_exercise(exercise_type)
+        
+    def _build_exercise(self, exercise_type):
+        """Build exercise data for the given type, or None if unknown"""
+        generator = self._generators.get(exercise_type)
+        if generator is None:
+            return None
+        exercise = generator()
+        
+        # Bitboards for single-AND membership tests on click
+        exercise['target_mask'] = _squares_mask(exercise['targets'])
+        exercise['invalid_mask'] = _squares_mask(exercise['invalids'])
+        return exercise
+        
+    def _apply_exercise(self, exercise):
+        """Place a pre-generated exercise on the board"""
+        self._apply_placements(exercise['pieces'])
+        self._apply_highlights(exercise['highlights'])
+        
+        self.current_pawn_square = exercise['pawn']
+        self.target_squares = exercise['targets']
+        self.invalid_squares = exercise['invalids']
+        self.target_mask = exercise['target_mask']
+        self.invalid_mask = exercise['invalid_mask']
+        
+    def _apply_placements(self, placements):
+        """Swap the previous exercise's pieces for the given placements"""
+        board = self.chess_board.board
+        for square in self._last_placed:
+            board.remove_piece_at(square)
+        for square, piece in placements:
+            board.set_piece_at(square, piece)
+        self._last_placed = [square for square, _ in placements]
+        self._static_board_surface = None
+        
+    def _apply_highlights(self, squares):
+        """Toggle only the highlights that differ from the current ones"""
+        for square in list(self.chess_board.highlighted_squares):
+            if square not in squares:
+                self.chess_board.unhighlight_square(square)
+        self.chess_board.highlight_squares(squares)
+            
     def _generate_basic_forward(self):
         """Generate exercise for basic forward movement"""
-        try:
-            # Clear board
-            self.chess_board.reset()
-            self.chess_board.board.clear()
-            
-            # Place a white pawn in the middle of the board
-            pawn_file = random.randint(1, 6)  # Avoid edges
-            pawn_rank = random.randint(2, 5)  # Middle ranks
-            pawn_square = chess.square(pawn_file, pawn_rank)
-            
-            self.chess_board.board.set_piece_at(pawn_square, chess.Piece(chess.PAWN, chess.WHITE))
-            self.current_pawn_square = pawn_square
-            
-            # The target square is one square forward
-            target_square = pawn_square + 8
-            if target_square <= 63:  # Validate square is on board
-                self.target_squares = [target_square]
-            else:
-                raise ValueError(f"Invalid target square: {target_square}")
-            
-            # Add some invalid squares (sideways, backward)
-            self.invalid_squares = [
-                pawn_square - 8,  # Backward
-                pawn_square + 1 if pawn_file < 7 else None,  # Right
-                pawn_square - 1 if pawn_file > 0 else None,  # Left
-            ]
-            self.invalid_squares = [sq for sq in self.invalid_squares if sq is not None and 0 <= sq <= 63]
-            
-            # Highlight the pawn
-            self.chess_board.highlight_square(pawn_square)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate basic forward exercise: {e}")
-            raise
+        # Place a white pawn in the middle of the board
+        pawn_file = random.randint(1, 6)  # Avoid edges
+        pawn_rank = random.randint(2, 5)  # Middle ranks
+        pawn_square = chess.square(pawn_file, pawn_rank)
+        
+        # The target square is one square forward
+        target_square = _PAWN_FORWARD[pawn_square]
+        if target_square < 0:  # Validate square is on board
+            raise ValueError(f"No square in front of {chess.square_name(pawn_square)}")
+        
+        return {
+            'pawn': pawn_square,
+            'pieces': [(pawn_square, _WHITE_PAWN)],
+            'targets': [target_square],
+            'invalids': _materialize_offsets(pawn_square, pawn_file, _INVALID_OFFSETS['basic_forward']),
+            'highlights': [pawn_square]  # Highlight the pawn
+        }
         
     def _generate_initial_double(self):
         """Generate exercise for initial two-square move"""
-        try:
-            # Clear board
-            self.chess_board.reset()
-            self.chess_board.board.clear()
-            
-            # Place a white pawn on the second rank
-            pawn_file = random.randint(1, 6)
-            pawn_square = chess.square(pawn_file, 1)  # Second rank
-            
-            self.chess_board.board.set_piece_at(pawn_square, chess.Piece(chess.PAWN, chess.WHITE))
-            self.current_pawn_square = pawn_square
-            
-            # Target squares are one and two squares forward
-            self.target_squares = []
-            one_forward = pawn_square + 8
-            two_forward = pawn_square + 16
-            
-            if one_forward <= 63:
-                self.target_squares.append(one_forward)
-            if two_forward <= 63:
-                self.target_squares.append(two_forward)
-                
-            if not self.target_squares:
-                raise ValueError("No valid target squares generated")
-            
-            # Invalid squares
-            self.invalid_squares = [
-                pawn_square + 24 if pawn_square + 24 <= 63 else None,  # Three squares forward
-                pawn_square + 7 if pawn_file > 0 else None,  # Diagonal without capture
-                pawn_square + 9 if pawn_file < 7 else None,  # Diagonal without capture
-            ]
-            self.invalid_squares = [sq for sq in self.invalid_squares if sq is not None and 0 <= sq <= 63]
-            
-            # Highlight the pawn
-            self.chess_board.highlight_square(pawn_square)
+        # Place a white pawn on the second rank
+        pawn_file = random.randint(1, 6)
+        pawn_square = chess.square(pawn_file, 1)  # Second rank
+        
+        # Target squares are one and two squares forward
+        target_squares = [sq for sq in (_PAWN_FORWARD[pawn_square], _PAWN_DBL[pawn_square]) if sq >= 0]
             
-        except Exception as e:
-            logger.error(f"Failed to generate initial double exercise: {e}")
-            raise
+        if not target_squares:
+            raise ValueError("No valid target squares generated")
+        
+        return {
+            'pawn': pawn_square,
+            'pieces': [(pawn_square, _WHITE_PAWN)],
+            'targets': target_squares,
+            'invalids': _materialize_offsets(pawn_square, pawn_file, _INVALID_OFFSETS['initial_double']),
+            'highlights': [pawn_square]
+        }
         
     def _generate_capture(self):
         """Generate exercise for diagonal capture"""
-        try:
-            # Clear board
-            self.chess_board.reset()
-            self.chess_board.board.clear()
-            
-            # Place a white pawn
-            pawn_file = random.randint(1, 6)
-            pawn_rank = random.randint(2, 5)
-            pawn_square = chess.square(pawn_file, pawn_rank)
-            
-            self.chess_board.board.set_piece_at(pawn_square, chess.Piece(chess.PAWN, chess.WHITE))
-            self.current_pawn_square = pawn_square
-            
-            # Place enemy pieces diagonally ahead
-            self.target_squares = []
-            
-            # Left diagonal capture
-            if pawn_file > 0 and pawn_rank < 7:
-                left_capture = pawn_square + 7
-                if 0 <= left_capture <= 63:
-                    self.chess_board.board.set_piece_at(left_capture, chess.Piece(chess.PAWN, chess.BLACK))
-                    self.target_squares.append(left_capture)
-                
-            # Right diagonal capture
-            if pawn_file < 7 and pawn_rank < 7:
-                right_capture = pawn_square + 9
-                if 0 <= right_capture <= 63:
-                    self.chess_board.board.set_piece_at(right_capture, chess.Piece(chess.KNIGHT, chess.BLACK))
-                    self.target_squares.append(right_capture)
-                
-            # The forward square is NOT a valid capture square
-            forward_square = pawn_square + 8
-            if forward_square <= 63:
-                self.invalid_squares.append(forward_square)
-                
-            if not self.target_squares:
-                # If no captures possible, regenerate
-                raise ValueError("No capture squares available, regenerating...")
-                
-            # Highlight the pawn
-            self.chess_board.highlight_square(pawn_square)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate capture exercise: {e}")
-            raise
+        # Place a white pawn
+        pawn_file = random.randint(1, 6)
+        pawn_rank = random.randint(2, 5)
+        pawn_square = chess.square(pawn_file, pawn_rank)
+        pieces = [(pawn_square, _WHITE_PAWN)]
+        
+        # Place enemy pieces on the attacked diagonals (left, then right)
+        target_squares = []
+        captures = (_PAWN_CAP_L[pawn_square], _PAWN_CAP_R[pawn_square])
+        for capture_square, enemy in zip(captures, (_BLACK_PAWN, _BLACK_KNIGHT)):
+            if capture_square >= 0:
+                pieces.append((capture_square, enemy))
+                target_squares.append(capture_square)
+            
+        if not target_squares:
+            # If no captures possible, regenerate
+            raise ValueError("No capture squares available, regenerating...")
+            
+        return {
+            'pawn': pawn_square,
+            'pieces': pieces,
+            'targets': target_squares,
+            'invalids': _materialize_offsets(pawn_square, pawn_file, _INVALID_OFFSETS['capture']),
+            'highlights': [pawn_square]
+        }
         
     def _generate_blocked(self):
         """Generate exercise for blocked pawns"""
-        try:
-            # Clear board
-            self.chess_board.reset()
-            self.chess_board.board.clear()
-            
-            # Place a white pawn
-            pawn_file = random.randint(1, 6)
-            pawn_rank = random.randint(2, 5)
-            pawn_square = chess.square(pawn_file, pawn_rank)
-            
-            self.chess_board.board.set_piece_at(pawn_square, chess.Piece(chess.PAWN, chess.WHITE))
-            self.current_pawn_square = pawn_square
-            
-            # Block the pawn with a piece directly in front
-            blocking_square = pawn_square + 8
-            if blocking_square <= 63:
-                self.chess_board.board.set_piece_at(blocking_square, chess.Piece(chess.BISHOP, chess.BLACK))
-            
-            # In this case, there are NO valid moves
-            self.target_squares = []
-            
-            # But we might have capture options
-            if pawn_file > 0:
-                left_capture = pawn_square + 7
-                if 0 <= left_capture <= 63 and random.choice([True, False]):
-                    self.chess_board.board.set_piece_at(left_capture, chess.Piece(chess.ROOK, chess.BLACK))
-                    self.target_squares.append(left_capture)
-                    
-            if pawn_file < 7:
-                right_capture = pawn_square + 9
-                if 0 <= right_capture <= 63 and random.choice([True, False]) and not self.target_squares:
-                    self.chess_board.board.set_piece_at(right_capture, chess.Piece(chess.QUEEN, chess.BLACK))
-                    self.target_squares.append(right_capture)
-                    
-            # Invalid squares include the blocked forward square
-            if blocking_square <= 63:
-                self.invalid_squares = [blocking_square]
-            
-            # Highlight the pawn
-            self.chess_board.highlight_square(pawn_square)
-            
-        except Exception as e:
-            logger.error(f"Failed to generate blocked exercise: {e}")
-            raise
+        # Place a white pawn
+        pawn_file = random.randint(1, 6)
+        pawn_rank = random.randint(2, 5)
+        pawn_square = chess.square(pawn_file, pawn_rank)
+        pieces = [(pawn_square, _WHITE_PAWN)]
+        
+        # Block the pawn with a piece directly in front
+        blocking_square = _PAWN_FORWARD[pawn_square]
+        if blocking_square >= 0:
+            pieces.append((blocking_square, _BLACK_BISHOP))
+        
+        # In this case, there are NO valid moves
+        target_squares = []
+        
+        # But we might have (at most one) capture option
+        captures = (_PAWN_CAP_L[pawn_square], _PAWN_CAP_R[pawn_square])
+        for capture_square, enemy in zip(captures, (_BLACK_ROOK, _BLACK_QUEEN)):
+            if capture_square >= 0 and self._rand_bool():
+                pieces.append((capture_square, enemy))
+                target_squares.append(capture_square)
+                break
+        
+        return {
+            'pawn': pawn_square,
+            'pieces': pieces,
+            'targets': target_squares,
+            'invalids': _materialize_offsets(pawn_square, pawn_file, _INVALID_OFFSETS['blocked']),
+            'highlights': [pawn_square]
+        }
+        
+    def _rand_bool(self):
+        """Return one random bit, drawing 64 at a time"""
+        if self._rng_bits_left == 0:
+            self._rng_bits = random.getrandbits(64)
+            self._rng_bits_left = 64
+        bit = self._rng_bits & 1
+        self._rng_bits >>= 1
+        self._rng_bits_left -= 1
+        return bit
         
     def _generate_en_passant(self):
         """Generate exercise for en passant (simplified)"""
-        try:
-            # This is an advanced concept, so we'll keep it simple
-            # Clear board
-            self.chess_board.reset()
-            self.chess_board.board.clear()
-            
-            # Place a white pawn on the 5th rank
-            pawn_file = random.randint(1, 6)
-            pawn_square = chess.square(pawn_file, 4)  # 5th rank
-            
-            self.chess_board.board.set_piece_at(pawn_square, chess.Piece(chess.PAWN, chess.WHITE))
-            self.current_pawn_square = pawn_square
-            
-            # Place a black pawn that just moved two squares
-            if pawn_file > 0:
-                enemy_file = pawn_file - 1
-            else:
-                enemy_file = pawn_file + 1
-                
-            enemy_square = chess.square(enemy_file, 4)
-            self.chess_board.board.set_piece_at(enemy_square, chess.Piece(chess.PAWN, chess.BLACK))
-            
-            # The en passant capture square
-            en_passant_square = chess.square(enemy_file, 5)
-            if 0 <= en_passant_square <= 63:
-                self.target_squares = [en_passant_square]
-            
-            # Normal forward move is also valid
-            forward_square = pawn_square + 8
-            if forward_square <= 63:
-                self.target_squares.append(forward_square)
-                
-            if not self.target_squares:
-                raise ValueError("No valid target squares for en passant")
+        # This is an advanced concept, so we'll keep it simple
+        # Place a white pawn on the 5th rank
+        pawn_file = random.randint(1, 6)
+        pawn_square = chess.square(pawn_file, 4)  # 5th rank
+        
+        # Place a black pawn that just moved two squares
+        if pawn_file > 0:
+            enemy_file = pawn_file - 1
+        else:
+            enemy_file = pawn_file + 1
             
-            # Highlight both pawns
-            self.chess_board.highlight_square(pawn_square)
-            self.chess_board.highlight_square(enemy_square)
+        enemy_square = chess.square(enemy_file, 4)
+        
+        # The en passant capture square
+        target_squares = []
+        en_passant_square = chess.square(enemy_file, 5)
+        if 0 <= en_passant_square <= 63:
+            target_squares = [en_passant_square]
+        
+        # Normal forward move is also valid
+        forward_square = _PAWN_FORWARD[pawn_square]
+        if forward_square >= 0:
+            target_squares.append(forward_square)
             
-        except Exception as e:
-            logger.error(f"Failed to generate en passant exercise: {e}")
-            raise
+        if not target_squares:
+            raise ValueError("No valid target squares for en passant")
+        
+        return {
+            'pawn': pawn_square,
+            'pieces': [(pawn_square, _WHITE_PAWN), (enemy_square, _BLACK_PAWN)],
+            'targets': target_squares,
+            'invalids': _materialize_offsets(pawn_square, pawn_file, _INVALID_OFFSETS['en_passant_setup']),
+            'highlights': [pawn_square, enemy_square]  # Highlight both pawns
+        }
         
     def handle_square_click(self, square):
         """Handle when a square is clicked"""
@@ -454,7 +630,7 @@ class PawnMovementState(BaseState):
             self.selected_square = square
             self.total_attempts += 1
             
-            if square in self.target_squares:
+            if chess.BB_SQUARES[square] & self.target_mask:
                 self.on_correct_move()
             else:
                 #print("incorrect move is starting executing")
@@ -464,100 +640,103 @@ class PawnMovementState(BaseState):
         except Exception as e:
             logger.error(f"Error handling square click: {e}")
             self.feedback_message = "Error processing move. Please try again."
+            self._feedback_is_correct = False
             self.show_feedback = True
+        
+        self._refresh_active_buttons()
+            
+    def _refresh_active_buttons(self):
+        """Rebuild the list of visible buttons after feedback/attempt changes"""
+        buttons = [self.back_button, self.hint_button]
+        if self.total_attempts > 2 and not self.show_feedback:
+            buttons.append(self.skip_button)
+        if self.show_feedback:
+            buttons.append(self.next_button)
+        self._active_buttons = buttons
+        # Force a button update so newly shown buttons pick up hover state
+        self._last_mouse_pos = (-1, -1)
             
     def on_correct_move(self):
         """Handle correct move selection"""
+        self.correct_moves += 1
+        self.show_feedback = True
+        self.feedback_message = "Correct! Well done!"
+        self._feedback_is_correct = True
+        
+        # Highlight the correct square in green
+        if self.selected_square is not None:
+            self.chess_board.select_square(self.selected_square)
+        
+        # Update progress
+        if self.exercise_type:
+            # Check if we've already completed max exercises for this type
+            if self.exercises_completed[self.exercise_type] < self.exercises_per_type:
+                self.exercises_completed[self.exercise_type] += 1
+                self._total_completed += 1
+            #self.progress_bar.set_value(self._total_completed)
+        
+        # Play success sound
         try:
-            self.correct_moves += 1
-            self.show_feedback = True
-            self.feedback_timer = 0
-            self.feedback_message = "Correct! Well done!"
-            
-            # Highlight the correct square in green
-            if self.selected_square is not None:
-                self.chess_board.select_square(self.selected_square)
-            
-            # Update progress
-            if self.exercise_type:
-                # Check if we've already completed max exercises for this type
-                if self.exercises_completed[self.exercise_type] < self.exercises_per_type:
-                    self.exercises_completed[self.exercise_type] += 1
-                total_completed = sum(self.exercises_completed.values())
-                #self.progress_bar.set_value(total_completed)
-            
-            # Play success sound
-            try:
-                self.engine.audio_manager.play_sound('success.mp3')
-            except Exception as e:
+            self._play_sound('success.mp3')
+        except Exception as e:
+            if logger.isEnabledFor(logging.WARNING):
                 logger.warning(f"Failed to play success sound: {e}")
-            
-            # Create celebration effect
-            self.create_celebration()
-            
-            # Add points
-            points = 100
-            try:
-                animated_text = AnimatedText(
-                    f"+{points} points!",
-                    (self.config.SCREEN_WIDTH // 2, 300),
-                    48,
-                    self.config.COLORS['secondary'],
-                    2.0,
-                    self.config
-                )
-                self.animated_texts.append(animated_text)
-            except Exception as e:
-                logger.warning(f"Failed to create animated text: {e}")
-                
+        
+        # Create celebration effect
+        self.create_celebration()
+        
+        # Add points
+        points = 100
+        try:
+            text_args = (
+                f"+{points} points!",
+                (self._center_x, 300),
+                48,
+                self.config.COLORS['secondary'],
+                2.0
+            )
+            if self._animtext_free:
+                animated_text = self._animtext_free.pop()
+                animated_text.reset(*text_args)
+            else:
+                animated_text = AnimatedText(*text_args, self.config)
+            self.animated_texts.append(animated_text)
         except Exception as e:
-            logger.error(f"Error in on_correct_move: {e}")
-            self.feedback_message = "Move registered correctly!"
-            self.show_feedback = True
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"Failed to create animated text: {e}")
         
     def on_incorrect_move(self):
         """Handle incorrect move selection"""
+        self.show_feedback = True
+        self._feedback_is_correct = False
+        
+        if self.selected_square is not None and chess.BB_SQUARES[self.selected_square] & self.invalid_mask:
+            self.feedback_message = "Not quite! Pawns can't move there."
+        elif self.selected_square == self.current_pawn_square:
+            self.feedback_message = "Click on a square where the pawn can move to."
+        else:
+            self.feedback_message = "That's not a valid move for this pawn."
+            
+        # Play error sound
         try:
-            #print("Incorrect move selected")
-            self.show_feedback = True
-            self.feedback_timer = 0
-            
-            if self.selected_square is not None and self.selected_square in self.invalid_squares:
-                self.feedback_message = "Not quite! Pawns can't move there."
-            elif self.selected_square == self.current_pawn_square:
-                self.feedback_message = "Click on a square where the pawn can move to."
-            else:
-                self.feedback_message = "That's not a valid move for this pawn."
-                
-            # Play error sound
-            try:
-                self.engine.audio_manager.play_sound('error.wav')
-            except Exception as e:
-                logger.warning(f"Failed to play error sound: {e}")
-                
-            #print(f"Feedback message: {self.feedback_message}")
-            
+            self._play_sound('error.wav')
         except Exception as e:
-            logger.error(f"Error in on_incorrect_move: {e}")
-            self.feedback_message = "That's not a valid move. Try again!"
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"Failed to play error sound: {e}")
             
     def toggle_hint(self):
         """Toggle hint display"""
-        try:
-            self.show_hint = not self.show_hint
-            if self.show_hint:
-                # Briefly highlight all valid moves
-                for square in self.target_squares:
-                    if 0 <= square <= 63:
-                        self.chess_board.highlight_square(square)
-        except Exception as e:
-            logger.error(f"Error toggling hint: {e}")
+        self.show_hint = not self.show_hint
+        if self.show_hint:
+            # Briefly highlight all valid moves
+            self.chess_board.highlight_squares(self.target_squares)
                     
     def skip_exercise(self):
         """Skip current exercise"""
         try:
             if not self.show_feedback and self.exercise_type:
                 self.exercises_completed[self.exercise_type] += 1
+                self._total_completed += 1
                 self.next_exercise()
         except Exception as e:
             logger.error(f"Error skipping exercise: {e}")
@@ -573,10 +752,7 @@ class PawnMovementState(BaseState):
                 self.current_type_index += 1
                 
             # Prevent going beyond total exercises
-            total_completed = sum(self.exercises_completed.values())
-            max_exercises = len(self.movement_types) * self.exercises_per_type
-            
-            if self.current_type_index >= len(self.movement_types) or total_completed >= max_exercises:
+            if self.current_type_index >= len(self.movement_types) or self._total_completed >= self._max_exercises:
                 self.complete_module()
             else:
                 self.generate_exercise()
@@ -585,84 +761,142 @@ class PawnMovementState(BaseState):
             logger.error(f"Error moving to next exercise: {e}")
             # Try to recover by moving to next type
             self.current_type_index += 1
-            total_completed = sum(self.exercises_completed.values())
-            max_exercises = len(self.movement_types) * self.exercises_per_type
-            if self.current_type_index >= len(self.movement_types) or total_completed >= max_exercises:
+            if self.current_type_index >= len(self.movement_types) or self._total_completed >= self._max_exercises:
                 self.complete_module()
             else:
                 self.generate_exercise()
             
     def complete_module(self):
         """Complete the pawn movement module"""
+        self.module_completed = True
+        self._completion_start = pygame.time.get_ticks()
+        self._enter_completion()
+        
+        # Create celebration
+        self._spawn_particles(
+            50,
+            (self._center_x, self.config.SCREEN_HEIGHT // 2),
+            (200, 400),
+            3.0,
+            (5, 15),
+            self._completion_palette
+        )
+            
+        # Play completion sound
         try:
-            self.module_completed = True
-            self.completion_timer = 0
-            
-            # Calculate accuracy
-            accuracy = (self.correct_moves / self.total_attempts * 100) if self.total_attempts > 0 else 0
-            
-            # Create celebration
-            for _ in range(50):
-                try:
-                    angle = random.uniform(0, 2 * 3.14159)
-                    speed = random.uniform(200, 400)
-                    self.celebration_particles.append({
-                        'x': self.config.SCREEN_WIDTH // 2,
-                        'y': self.config.SCREEN_HEIGHT // 2,
-                        'vx': speed * math.cos(angle),
-                        'vy': speed * math.sin(angle),
-                        'color': random.choice([
-                            (255, 215, 0),
-                            (255, 255, 0),
-                            self.config.COLORS.get('accent', (155, 89, 182))
-                        ]),
-                        'life': 3.0,
-                        'size': random.randint(5, 15)
-                    })
-                except Exception as e:
-                    logger.warning(f"Failed to create celebration particle: {e}")
-                    break
-                
-            # Play completion sound
-            try:
-                self.engine.audio_manager.play_sound('complete.wav')
-            except Exception as e:
-                logger.warning(f"Failed to play completion sound: {e}")
-                
+            self._play_sound('complete.wav')
         except Exception as e:
-            logger.error(f"Error completing module: {e}")
-            # Still mark as completed and return to menu
-            self.module_completed = True
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(f"Failed to play completion sound: {e}")
+        
+    def _enter_completion(self):
+        """Render the completion screen once so render() only has to blit it"""
+        center_x = self._center_x
+        accuracy = self.correct_moves * 100 / max(self.total_attempts, 1)
+        
+        success_surface = self._success_font.render("Congratulations!", True, (255, 215, 0))
+        complete_surface = self.title_font.render("You've mastered pawn movement!", True, (255, 255, 255))
+        accuracy_surface = self.instruction_font.render(f"Accuracy: {accuracy:.1f}%", True, (255, 255, 255))
+        self._completion_blits = [
+            (self._overlay, (0, 0)),
+            (success_surface, success_surface.get_rect(center=(center_x, 200))),
+            (complete_surface, complete_surface.get_rect(center=(center_x, 300))),
+            (accuracy_surface, accuracy_surface.get_rect(center=(center_x, 400))),
+        ]
         
     def create_celebration(self):
         """Create visual celebration effect"""
-        try:
-            import math
-            for _ in range(20):
-                angle = random.uniform(0, 2 * 3.14159)
-                speed = random.uniform(100, 300)
-                self.celebration_particles.append({
-                    'x': self.config.SCREEN_WIDTH // 2,
-                    'y': 350,
-                    'vx': speed * math.cos(angle),
-                    'vy': speed * math.sin(angle),
-                    'color': random.choice([
-                        self.config.COLORS.get('accent', (155, 89, 182)),
-                        self.config.COLORS.get('secondary', (46, 204, 113)),
-                        (255, 255, 0)
-                    ]),
-                    'life': 1.5,
-                    'size': random.randint(3, 8)
-                })
-        except Exception as e:
-            logger.warning(f"Failed to create celebration effect: {e}")
+        self._spawn_particles(
+            20,
+            (self._center_x, 350),
+            (100, 300),
+            1.5,
+            (3, 8),
+            self._celebration_palette
+        )
+            
+    def _spawn_particles(self, count, origin, speed_range, life, size_range, palette):
+        """Append a radial burst of particles to the particle arrays"""
+        start = self._p_count
+        if count <= 0:
+            return
+        end = start + count
+        if end > len(self._p_pos):
+            self._grow_particles(end)
+        
+        angles = np.random.uniform(0, _TWO_PI, count)
+        speeds = np.random.uniform(speed_range[0], speed_range[1], count)
+        self._p_pos[start:end] = origin
+        vel = self._p_vel[start:end]
+        np.cos(angles, out=vel[:, 0])
+        np.sin(angles, out=vel[:, 1])
+        vel *= speeds[:, None]
+        self._p_spawn[start:end] = pygame.time.get_ticks()
+        self._p_life[start:end] = int(life * 1000)
+        self._p_size[start:end] = np.random.randint(size_range[0], size_range[1] + 1, count)
+        self._p_color[start:end] = palette[np.random.randint(0, len(palette), count)]
+        self._p_count = end
+        
+    def _grow_particles(self, needed):
+        """Reallocate the particle arrays with room for at least needed particles"""
+        capacity = max(needed, 2 * len(self._p_pos))
+        count = self._p_count
+        for name in ('_p_pos', '_p_vel', '_p_spawn', '_p_life', '_p_size', '_p_color', '_p_step'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:count] = old[:count]
+            setattr(self, name, new)
+        
+    def _update_particles(self, dt):
+        """Integrate live particles and compact out the dead ones"""
+        count = self._p_count
+        if not count:
+            return
+        
+        pos = self._p_pos[:count]
+        vel = self._p_vel[:count]
+        
+        if _step_particles is not None:
+            _step_particles(pos, vel, np.float32(dt), np.float32(_GRAVITY))
+        else:
+            # In-place ufuncs so the integration allocates nothing per frame
+            step = self._p_step[:count]
+            np.multiply(vel, dt, out=step)
+            pos += step
+            vel[:, 1] += _GRAVITY * dt
+        
+        # Lifetimes are measured against the tick clock rather than decremented per frame
+        alive = (pygame.time.get_ticks() - self._p_spawn[:count]) < self._p_life[:count]
+        # Gravity only pulls down, so anything below the screen will never come back
+        alive &= pos[:, 1] < self._p_cull_y
+        remaining = int(np.count_nonzero(alive))
+        if remaining < count:
+            arrays = (self._p_pos, self._p_vel, self._p_spawn, self._p_life, self._p_size, self._p_color)
+            for array in arrays:
+                array[:remaining] = array[:count][alive]
+            self._p_count = remaining
+            
+    def _update_animated_texts(self, dt):
+        """Update animated texts and return how many are still running"""
+        texts = self.animated_texts
+        release = self._animtext_free.append
+        write = 0
+        for text in texts:
+            text.update(dt)
+            if text.is_finished():
+                release(text)
+            else:
+                texts[write] = text
+                write += 1
+        return write
             
     def on_back_clicked(self):
         """Handle back button click"""
         try:
             self.engine.change_state(GameState.MAIN_MENU)
         except Exception as e:
-            logger.error(f"Error returning to main menu: {e}")
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(f"Error returning to main menu: {e}")
             # Force quit to main menu
             try:
                 self.engine.running = False
@@ -671,37 +905,32 @@ class PawnMovementState(BaseState):
         
     def handle_event(self, event):
         """Handle events"""
-        try:
-            # Handle button events
-            #print("handle event is called in pawn movement state")
-            self.back_button.handle_event(event)
-            self.hint_button.handle_event(event)
+        event_type = event.type
+        if event_type not in self._INTERESTING_EVENTS:
+            return
+        self._dirty = True
             
-            if self.total_attempts > 2 and not self.show_feedback:
-                self.skip_button.handle_event(event)
+        try:
+            # Keyboard shortcuts
+            if event_type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE and self.show_feedback:
+                    self.next_exercise()
+                elif event.key == pygame.K_h:
+                    self.toggle_hint()
+                return
                 
-            if self.show_feedback:
-                self.next_button.handle_event(event)
+            # Handle button events (iterate a snapshot: a click may rebuild the list)
+            for button in tuple(self._active_buttons):
+                button.handle_event(event)
                 
             # Handle mouse clicks on board
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event_type == pygame.MOUSEBUTTONDOWN:
                 try:
                     square = self.chess_board.get_square_from_pos(event.pos)
                     self.handle_square_click(square)
                 except Exception as e:
                     logger.error(f"Error getting square from position: {e}")
                     
-                #print(f"handle event is returned successfully")
-                
-            # Keyboard shortcuts
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE and self.show_feedback:
-                    self.next_exercise()
-                elif event.key == pygame.K_h:
-                    self.toggle_hint()
-                    
-            #print("handle event is completed successfully")
-            
         except Exception as e:
             logger.error(f"Error handling event: {e}")
             
@@ -711,55 +940,37 @@ class PawnMovementState(BaseState):
             super().update(dt)
             #print("update function is called in pawn movement state")
             
-            # Update UI elements
+            # Update UI elements only when the mouse moved or a button is still animating
             mouse_pos = pygame.mouse.get_pos()
-            self.back_button.update(dt, mouse_pos)
-            self.hint_button.update(dt, mouse_pos)
-            
-            if self.total_attempts > 2 and not self.show_feedback:
-                self.skip_button.update(dt, mouse_pos)
-                
-            if self.show_feedback:
-                self.next_button.update(dt, mouse_pos)
-                
-            # Update feedback timer
-            if self.show_feedback and not self.module_completed:
-                self.feedback_timer += dt
+            buttons = self._active_buttons
+            if mouse_pos != self._last_mouse_pos or not all(
+                    not b.is_hovered and b.hover_scale == 1.0 and not b.press_offset for b in buttons):
+                for button in buttons:
+                    button.update(dt, mouse_pos)
+                self._last_mouse_pos = mouse_pos
+                self._dirty = True
                 
-            # Update animated texts
-            for text in self.animated_texts[:]:
-                try:
-                    text.update(dt)
-                    if text.is_finished():
-                        self.animated_texts.remove(text)
-                except Exception as e:
-                    logger.warning(f"Error updating animated text: {e}")
-                    self.animated_texts.remove(text)
+            # Update animated texts, compacting survivors to the front in place
+            try:
+                alive = self._update_animated_texts(dt)
+                del self.animated_texts[alive:]
+            except Exception as e:
+                logger.warning(f"Error updating animated texts: {e}")
+                self.animated_texts.clear()
                     
             # Update celebration particles
-            for particle in self.celebration_particles[:]:
-                try:
-                    particle['x'] += particle['vx'] * dt
-                    particle['y'] += particle['vy'] * dt
-                    particle['vy'] += 500 * dt  # Gravity
-                    particle['life'] -= dt
-                    particle['size'] = max(1, particle['size'] - dt * 2)
-                    
-                    if particle['life'] <= 0:
-                        self.celebration_particles.remove(particle)
-                except Exception as e:
-                    logger.warning(f"Error updating particle: {e}")
-                    self.celebration_particles.remove(particle)
+            try:
+                self._update_particles(dt)
+            except Exception as e:
+                logger.warning(f"Error updating particles: {e}")
+                self._p_count = 0
                     
             # Update arrow animation
-            self.arrow_animation += dt * 2
-            if self.arrow_animation > 1:
-                self.arrow_animation = 0
+            self.arrow_animation = math.fmod(self.arrow_animation + dt * 2.0, 1.0)
                 
             # Check module completion
             if self.module_completed:
-                self.completion_timer += dt
-                if self.completion_timer > 5.0:
+                if pygame.time.get_ticks() - self._completion_start > 5000:
                     self.engine.change_state(GameState.MAIN_MENU)
                     
             #print("update function is completed in pawn movement state")
@@ -767,16 +978,45 @@ class PawnMovementState(BaseState):
         except Exception as e:
             logger.error(f"Error in update: {e}")
             
+    def _text(self, font, text, color):
+        """Return the rendered surface for a piece of text, caching it"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= _TEXT_CACHE_LIMIT:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+        
+    def _circle_sprite(self, color, radius):
+        """Return a cached transparent surface with an anti-aliased filled circle on it"""
+        key = (color, radius)
+        sprite = self._circle_cache.get(key)
+        if sprite is None:
+            # gfxdraw circles span 2r+1 pixels, centred on (r, r)
+            diameter = radius * 2 + 1
+            sprite = pygame.Surface((diameter, diameter), pygame.SRCALPHA)
+            pygame.gfxdraw.filled_circle(sprite, radius, radius, radius, color)
+            pygame.gfxdraw.aacircle(sprite, radius, radius, radius, color)
+            self._circle_cache[key] = sprite
+        return sprite
+        
     def render(self, screen):
         """Render the pawn movement state"""
+        animating = bool(self._p_count or self.animated_texts or self.module_completed)
+        if not (animating or self._dirty) and self._scene_cache is not None:
+            screen.blit(self._scene_cache, (0, 0))
+            return
+            
         try:
             # Clear screen
-            screen.fill(self.config.COLORS['background'])
+            screen.fill(self._c_bg)
             
             # Draw title
             title_text = "Learn Pawn Movement"
-            title_surface = self.title_font.render(title_text, True, self.config.COLORS['text_dark'])
-            title_rect = title_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 40))
+            title_surface = self._text(self.title_font, title_text, self._c_text)
+            title_rect = title_surface.get_rect(center=(self._center_x, 40))
             screen.blit(title_surface, title_rect)
             
             # Draw progress bar
@@ -785,106 +1025,106 @@ class PawnMovementState(BaseState):
             # Draw current exercise type
             if not self.module_completed and self.exercise_type:
                 type_text = self.exercise_type.replace('_', ' ').title()
-                type_surface = self.instruction_font.render(f"Exercise: {type_text}", True, 
-                                                          self.config.COLORS['primary'])
-                type_rect = type_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 100))
+                type_surface = self._text(self.instruction_font, f"Exercise: {type_text}",
+                                          self._c_primary)
+                type_rect = type_surface.get_rect(center=(self._center_x, 100))
                 screen.blit(type_surface, type_rect)
                 
                 # Draw instruction
-                instruction = self.instructions.get(self.exercise_type, "")
-                inst_surface = self.info_font.render(instruction, True, self.config.COLORS['text_dark'])
-                inst_rect = inst_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 140))
+                inst_surface = self._instr_surfaces.get(self.exercise_type)
+                if inst_surface is None:
+                    inst_surface = self._text(self.info_font, "", self._c_text)
+                inst_rect = inst_surface.get_rect(center=(self._center_x, 140))
                 screen.blit(inst_surface, inst_rect)
                 
             # Draw chess board
             try:
-                self.chess_board.draw()
+                if self._static_board_surface is None:
+                    self._static_board_surface = self.chess_board.render_to_surface()
+                screen.blit(self._static_board_surface,
+                            (self.chess_board.board_offset_x, self.chess_board.board_offset_y))
+                self.chess_board.draw_overlays()
             except Exception as e:
                 logger.error(f"Error drawing chess board: {e}")
                 # Draw error message
-                error_surface = self.instruction_font.render("Error displaying board", True, 
-                                                            self.config.COLORS.get('error', (255, 0, 0)))
-                error_rect = error_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 400))
+                error_surface = self._text(self.instruction_font, "Error displaying board",
+                                           self._c_error)
+                error_rect = error_surface.get_rect(center=(self._center_x, 400))
                 screen.blit(error_surface, error_rect)
             
             # Draw hint if enabled
             if self.show_hint and not self.show_feedback:
-                hint_surface = self.info_font.render("Valid moves are highlighted in yellow", 
-                                                   True, self.config.COLORS['secondary'])
-                hint_rect = hint_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 670))
+                hint_surface = self._text(self.info_font, "Valid moves are highlighted in yellow",
+                                          self._c_secondary)
+                hint_rect = hint_surface.get_rect(center=(self._center_x, 670))
                 screen.blit(hint_surface, hint_rect)
                 
             # Draw feedback
             if self.feedback_message and not self.module_completed:
-                color = self.config.COLORS['secondary'] if "Correct" in self.feedback_message else self.config.COLORS.get('error', (255, 0, 0))
-                feedback_surface = self.instruction_font.render(self.feedback_message, True, color)
-                feedback_rect = feedback_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 600))
+                color = self._c_secondary if self._feedback_is_correct else self._c_error
+                feedback_surface = self._text(self.instruction_font, self.feedback_message, color)
+                feedback_rect = feedback_surface.get_rect(center=(self._center_x, 600))
                 screen.blit(feedback_surface, feedback_rect)
                 
             # Draw navigation buttons
-            self.back_button.render(screen)
-            self.hint_button.render(screen)
-            
-            if self.total_attempts > 2 and not self.show_feedback:
-                self.skip_button.render(screen)
-                
-            if self.show_feedback:
-                self.next_button.render(screen)
+            for button in self._active_buttons:
+                button.render(screen)
                 
             # Draw animated texts
-            for text in self.animated_texts:
-                try:
+            try:
+                for text in self.animated_texts:
                     text.render(screen)
-                except Exception as e:
-                    logger.warning(f"Error rendering animated text: {e}")
+            except Exception as e:
+                logger.warning(f"Error rendering animated texts: {e}")
                 
             # Draw celebration particles
-            for particle in self.celebration_particles:
-                try:
-                    pygame.draw.circle(screen, particle['color'], 
-                                     (int(particle['x']), int(particle['y'])), 
-                                     int(particle['size']))
-                except Exception as e:
-                    logger.warning(f"Error rendering particle: {e}")
+            count = self._p_count
+            # Particles shrink by 2px per second of age, down to 1px
+            ages = pygame.time.get_ticks() - self._p_spawn[:count]
+            sizes = np.maximum(self._p_size[:count] - ages * 0.002, 1)
+            # Bind lookups to locals; this loop runs once per live particle
+            circle_cache = self._circle_cache
+            circle_sprite = self._circle_sprite
+            blit_seq = []
+            append = blit_seq.append
+            for (x, y), color, size in zip(self._p_pos[:count].tolist(),
+                                           self._p_color[:count].tolist(),
+                                           sizes.astype(np.int32).tolist()):
+                color = tuple(color)
+                sprite = circle_cache.get((color, size))
+                if sprite is None:
+                    sprite = circle_sprite(color, size)
+                append((sprite, (int(x) - size, int(y) - size)))
+            try:
+                screen.blits(blit_seq, doreturn=False)
+            except Exception as e:
+                logger.warning(f"Error rendering particles: {e}")
                 
             # Draw completion screen
             if self.module_completed:
                 try:
-                    # Draw overlay
-                    overlay = pygame.Surface((screen.get_width(), screen.get_height()))
-                    overlay.set_alpha(128)
-                    overlay.fill((0, 0, 0))
-                    screen.blit(overlay, (0, 0))
-                    
-                    # Draw success message
-                    success_font = pygame.font.Font(None, 72)
-                    success_text = "Congratulations!"
-                    success_surface = success_font.render(success_text, True, (255, 215, 0))
-                    success_rect = success_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 200))
-                    screen.blit(success_surface, success_rect)
-                    
-                    # Draw completion message
-                    complete_text = "You've mastered pawn movement!"
-                    complete_surface = self.title_font.render(complete_text, True, (255, 255, 255))
-                    complete_rect = complete_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 300))
-                    screen.blit(complete_surface, complete_rect)
-                    
-                    # Draw accuracy
-                    accuracy = (self.correct_moves / self.total_attempts * 100) if self.total_attempts > 0 else 0
-                    accuracy_text = f"Accuracy: {accuracy:.1f}%"
-                    accuracy_surface = self.instruction_font.render(accuracy_text, True, (255, 255, 255))
-                    accuracy_rect = accuracy_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2, 400))
-                    screen.blit(accuracy_surface, accuracy_rect)
+                    # Overlay, title, message and accuracy were rendered by _enter_completion()
+                    screen.blits(self._completion_blits, doreturn=False)
                 except Exception as e:
                     logger.error(f"Error rendering completion screen: {e}")
                     
+            # Animated frames are redrawn anyway; keep a copy once the scene settles
+            if not animating:
+                if self._scene_cache is None:
+                    self._scene_cache = screen.copy()
+                else:
+                    self._scene_cache.blit(screen, (0, 0))
+            # Stay dirty while animating so the frame after the last particle is redrawn
+            self._dirty = animating
+                    
         except Exception as e:
             logger.error(f"Critical error in render: {e}")
             # Try to draw a basic error message
             try:
                 screen.fill((200, 200, 200))
-                font = pygame.font.SysFont('Arial', 24)
-                error_text = font.render("Error: Unable to render. Press Back to return.", True, (255, 0, 0))
-                screen.blit(error_text, (50, 50))
+                if self._render_error_surface is None:
+                    self._render_error_surface = self._error_font.render(
+                        "Error: Unable to render. Press Back to return.", True, (255, 0, 0))
+                screen.blit(self._render_error_surface, (50, 50))
             except:
                 pass
\ No newline at end of file
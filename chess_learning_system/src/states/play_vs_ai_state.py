@@ -4,9 +4,10 @@
 import pygame
 import sys
 import threading
-import queue
 import time
 import math
+from collections import defaultdict
+from itertools import chain
 
 # Import the chess engine and AI from the same directory
 try:
@@ -37,6 +38,70 @@ except ImportError:
         MAIN_MENU = 'main_menu'
 
 
+# Rendered text surfaces shared by the panels and title, least recently used evicted first
+_TEXT_CACHE = {}
+_TEXT_CACHE_SIZE = 512
+
+
+# Default fonts by size, shared by every button, panel and piece image
+_FONT_CACHE = {}
+
+
+def _get_font(size, bold=False):
+    """Return a cached default font of the given size"""
+    key = (size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            font = pygame.font.Font(None, size)
+        except Exception:
+            # Fallback to system font
+            font = pygame.font.SysFont('Arial', size, bold=bold)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Colour filling the cut-off corners of cached panel backgrounds; never drawn
+_PANEL_CORNER_KEY = (255, 0, 255)
+
+
+# Room the cached board keeps left of the squares for rank labels and below them for file labels
+_BOARD_CACHE_LEFT = 25
+_BOARD_CACHE_BOTTOM = 20
+
+
+# Offsets of the four copies that make up the title glow
+_GLOW_OFFSETS = ((2, 2), (-2, -2), (2, -2), (-2, 2))
+
+
+def _convert_alpha(surface):
+    """Convert a per-pixel-alpha surface to the display format once a display exists"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+
+def _convert(surface):
+    """Convert an opaque surface to the display format once a display exists"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
+def _render_cached(font, text, color):
+    """Render text with the given font, reusing a cached surface when possible"""
+    # Fonts live in _FONT_CACHE for the whole run, so their id() is a stable key
+    key = (id(font), text, color)
+    surface = _TEXT_CACHE.pop(key, None)
+    if surface is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_SIZE:
+            del _TEXT_CACHE[next(iter(_TEXT_CACHE))]
+        surface = _convert_alpha(font.render(text, True, color))
+    # Re-inserting keeps the dict ordered from least to most recently used
+    _TEXT_CACHE[key] = surface
+    return surface
+
+
 class ProfessionalButton:
     """Professional styled button for the chess game"""
     
@@ -72,19 +137,81 @@ class ProfessionalButton:
         self.hover_color = self._brighten_color(self.base_color, 1.2)
         self.pressed_color = self._darken_color(self.base_color, 0.8)
         
+        # Border and highlight shades per face, worked out once
+        self.border_colors = {
+            'base': self._darken_color(self.base_color, 0.7),
+            'hover': self._darken_color(self.hover_color, 0.7),
+            'pressed': self._darken_color(self.pressed_color, 0.7),
+        }
+        self.highlight_colors = {
+            'base': self._brighten_color(self.base_color, 1.3),
+            'hover': self._brighten_color(self.hover_color, 1.3),
+        }
+        
         # Font
-        self.font = pygame.font.Font(None, 20)
+        self.font = _get_font(20)
+        
+        # Pre-rendered button faces and label; render() only blits these
+        self._build_surfaces()
+    
+    def _build_surfaces(self):
+        """Composite the base, hover and pressed faces and render the label once"""
+        self._cached = {
+            'base': self._build_face(self.base_color, 'base'),
+            'hover': self._build_face(self.hover_color, 'hover'),
+            'pressed': self._build_face(self.pressed_color, 'pressed'),
+        }
+        self._text_surface = self.font.render(self.text, True, self.text_color)
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+    
+    def _build_face(self, color, state):
+        """Draw one button face (shadow, body, border, highlight) onto its own surface"""
+        width, height = self.rect.width, self.rect.height
+        # Two extra pixels on each axis leave room for the offset shadow
+        face = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+        body_rect = pygame.Rect(0, 0, width, height)
+        
+        # Draw button with modern styling
+        pygame.draw.rect(face, color, body_rect, border_radius=8)
+        
+        # Add subtle shadow effect
+        shadow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surface, (0, 0, 0, 50), (0, 0, width, height), border_radius=8)
+        face.blit(shadow_surface, (2, 2))
+        
+        # Draw main button
+        pygame.draw.rect(face, color, body_rect, border_radius=8)
+        
+        # Add border
+        pygame.draw.rect(face, self.border_colors[state], body_rect, 2, border_radius=8)
+        
+        # Add inner highlight for 3D effect (not on the pressed face)
+        highlight_color = self.highlight_colors.get(state)
+        if highlight_color is not None:
+            highlight_surface = pygame.Surface((width - 2, height // 3), pygame.SRCALPHA)
+            pygame.draw.rect(highlight_surface, (*highlight_color, 80), (0, 0, width - 2, height // 3), border_radius=6)
+            face.blit(highlight_surface, (1, 1))
+        
+        return _convert_alpha(face)
     
-    def _brighten_color(self, color, factor):
-        return tuple(min(255, int(c * factor)) for c in color)
+    @staticmethod
+    def _brighten_color(color, factor):
+        return (min(255, int(color[0] * factor)), min(255, int(color[1] * factor)), min(255, int(color[2] * factor)))
     
-    def _darken_color(self, color, factor):
-        return tuple(int(c * factor) for c in color)
+    @staticmethod
+    def _darken_color(color, factor):
+        return (int(color[0] * factor), int(color[1] * factor), int(color[2] * factor))
     
     def update(self, dt, mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        """Track hover; returns True when the hover state changed"""
+        hovered = bool(self.rect.collidepoint(mouse_pos))
+        changed = hovered != self.is_hovered
+        self.is_hovered = hovered
+        return changed
     
     def handle_event(self, event):
+        """Track presses and fire the callback; returns True when the pressed state changed"""
+        was_pressed = self.is_pressed
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.is_hovered:
                 self.is_pressed = True
@@ -92,45 +219,22 @@ class ProfessionalButton:
             if event.button == 1 and self.is_pressed and self.is_hovered:
                 self.callback()
             self.is_pressed = False
+        return was_pressed != self.is_pressed
     
-    def render(self, screen):
-        # Determine current color
+    def blit_items(self):
+        """(surface, dest) pairs for the current face and the label, for batching with blits()"""
+        # Pick the pre-rendered face for the current state
         if self.is_pressed:
-            color = self.pressed_color
+            face = self._cached['pressed']
         elif self.is_hovered:
-            color = self.hover_color
+            face = self._cached['hover']
         else:
-            color = self.base_color
-        
-        # Draw button with modern styling
-        pygame.draw.rect(screen, color, self.rect, border_radius=8)
-        
-        # Add subtle shadow effect
-        shadow_rect = pygame.Rect(self.rect.x + 2, self.rect.y + 2, self.rect.width, self.rect.height)
-        shadow_color = (0, 0, 0, 50)
-        shadow_surface = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, shadow_color, (0, 0, self.rect.width, self.rect.height), border_radius=8)
-        screen.blit(shadow_surface, (shadow_rect.x, shadow_rect.y))
+            face = self._cached['base']
         
-        # Draw main button
-        pygame.draw.rect(screen, color, self.rect, border_radius=8)
-        
-        # Add border
-        border_color = self._darken_color(color, 0.7)
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=8)
-        
-        # Add inner highlight for 3D effect
-        if not self.is_pressed:
-            highlight_rect = pygame.Rect(self.rect.x + 1, self.rect.y + 1, self.rect.width - 2, self.rect.height // 3)
-            highlight_color = self._brighten_color(color, 1.3)
-            highlight_surface = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(highlight_surface, (*highlight_color, 80), (0, 0, highlight_rect.width, highlight_rect.height), border_radius=6)
-            screen.blit(highlight_surface, highlight_rect.topleft)
-        
-        # Draw text
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        return (face, self.rect.topleft), (self._text_surface, self._text_rect)
+    
+    def render(self, screen):
+        screen.blits(self.blit_items(), doreturn=False)
 
 
 class StatusPanel:
@@ -141,10 +245,30 @@ class StatusPanel:
         self.size = size
         self.config = config
         self.rect = pygame.Rect(pos[0], pos[1], size[0], size[1])
-        self.font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 28)
+        self.font = _get_font(24)
+        self.title_font = _get_font(28)
+        self._backgrounds = {}  # panel_type -> pre-drawn background
+        self._frame = None  # Background with the last title and lines drawn in
+        self._frame_key = None
+    
+    def _build_background(self, bg_color, border_color):
+        """Draw the rounded panel once onto an opaque surface; the corners are colour-keyed out"""
+        surface = pygame.Surface(self.rect.size)
+        surface.fill(_PANEL_CORNER_KEY)
+        local_rect = surface.get_rect()
+        pygame.draw.rect(surface, bg_color, local_rect, border_radius=10)
+        pygame.draw.rect(surface, border_color, local_rect, 2, border_radius=10)
+        surface = _convert(surface)
+        surface.set_colorkey(_PANEL_CORNER_KEY, pygame.RLEACCEL)
+        return surface
     
     def render(self, screen, title, content_lines, panel_type='info'):
+        # Same text as last frame: reuse the composed panel
+        key = (title, tuple(content_lines), panel_type)
+        if key == self._frame_key:
+            screen.blit(self._frame, self.rect)
+            return
+        
         # Color scheme based on panel type
         if panel_type == 'info':
             bg_color = (236, 240, 241)
@@ -173,21 +297,29 @@ class StatusPanel:
             text_color = (52, 73, 94)
         
         # Draw panel background
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=10)
-        pygame.draw.rect(screen, border_color, self.rect, 2, border_radius=10)
+        background = self._backgrounds.get(panel_type)
+        if background is None:
+            background = self._backgrounds[panel_type] = self._build_background(bg_color, border_color)
+        frame = background.copy()
+        frame.set_colorkey(_PANEL_CORNER_KEY, pygame.RLEACCEL)
+        centerx = self.rect.width // 2
         
         # Draw title
-        title_surface = self.title_font.render(title, True, title_color)
-        title_rect = title_surface.get_rect(centerx=self.rect.centerx, top=self.rect.top + 10)
-        screen.blit(title_surface, title_rect)
+        title_surface = _render_cached(self.title_font, title, title_color)
+        title_rect = title_surface.get_rect(centerx=centerx, top=10)
+        frame.blit(title_surface, title_rect)
         
         # Draw content lines
         y_offset = title_rect.bottom + 15
         for line in content_lines:
-            line_surface = self.font.render(line, True, text_color)
-            line_rect = line_surface.get_rect(centerx=self.rect.centerx, top=y_offset)
-            screen.blit(line_surface, line_rect)
+            line_surface = _render_cached(self.font, line, text_color)
+            line_rect = line_surface.get_rect(centerx=centerx, top=y_offset)
+            frame.blit(line_surface, line_rect)
             y_offset += 25
+        
+        self._frame = frame
+        self._frame_key = key
+        screen.blit(frame, self.rect)
 
 
 class AIChessGameState(BaseState):
@@ -210,12 +342,34 @@ class AIChessGameState(BaseState):
         self.BOARD_OFFSET_X = 50
         self.BOARD_OFFSET_Y = 120
         
+        # Board rect reused for every click
+        self._board_rect = pygame.Rect(self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y, self.BOARD_WIDTH, self.BOARD_HEIGHT)
+        
+        # Screen position of every square, indexed row * 8 + col
+        self._square_topleft = tuple(
+            (self.BOARD_OFFSET_X + col * self.SQ_SIZE, self.BOARD_OFFSET_Y + row * self.SQ_SIZE)
+            for row in range(8) for col in range(8)
+        )
+        self._selection_overlay = None
+        self._move_overlay = None
+        
+        # Status panel arguments and the game state they were built from
+        self._status_key = None
+        self._status_args = None
+        
+        # Composed game-over screen and the (screen size, result text) it was built for
+        self._gameover_overlay = None
+        self._gameover_key = None
+        
         # Game state variables
         self.gs = None
         self.validMoves = []
+        self._moves_by_start = {}  # (startRow, startCol) -> valid moves of that piece
         self.moveMade = False
         self.animate = False
         self.gameOver = False
+        self.move_animation_time = 0.2  # Seconds a move is shown before play continues
+        self._anim_end_time = 0.0
         
         # Player configuration
         self.playerOne = True   # True = Human, False = AI for White
@@ -223,6 +377,7 @@ class AIChessGameState(BaseState):
         
         # Move selection
         self.sqSelected = ()
+        self._selection_own = False  # selected square holds a piece of the side to move
         self.playerClicks = []
         
         # AI state management - FIXED VERSION
@@ -230,12 +385,20 @@ class AIChessGameState(BaseState):
         self.ai_move_ready = False
         self.ai_move = None
         self.ai_thinking_start_time = 0
-        self.min_ai_think_time = 1.0  # Minimum 1 second thinking time
-        self.ai_thread = None
-        self.move_queue = queue.Queue()
+        self.ai_time_budget = 0.5  # Seconds the iterative deepening search may use per move
+        self.ai_thread = None  # One long-lived worker, started in enter()
+        self._ai_cv = threading.Condition()  # Guards the job slot and the result hand-off
+        self._ai_job = None  # (position copy, valid moves, cancel event) waiting for the worker
+        self._ai_cancel = None  # Cancel event of the job currently queued or running
+        self._ai_shutdown = False
+        self._ai_running = False  # True from the worker's start until it has seen the shutdown
+        self._ai_result = None  # Move handed over by the worker thread
+        self._ai_done = threading.Event()  # Set once _ai_result holds the worker's answer
         
         # Images and fonts
         self.images = {}
+        self._atlas = None
+        self._atlas_rects = {}
         
         # Professional board colors (matching other modules)
         self.light_square_color = (240, 217, 181)  # Light squares
@@ -244,15 +407,38 @@ class AIChessGameState(BaseState):
         self.selected_color = (100, 149, 237)      # Blue selection
         self.valid_move_color = (144, 238, 144)    # Light green for valid moves
         
+        # Inner shadow shades of the two square colours
+        self._light_shadow = tuple(int(c * 0.9) for c in self.light_square_color)
+        self._dark_shadow = tuple(int(c * 0.9) for c in self.dark_square_color)
+        
         # UI elements
         self.status_panel = None
         self.move_log_panel = None
         self.buttons = {}
+        self._button_list = []
+        
+        # Logged moves already formatted, their str() and the panel lines, extended as moves are made
+        self._move_log_moves = []
+        self._move_log_strings = []
+        self._move_log_content = None
+        
+        # Pre-drawn board (shadow, frame, squares, coordinates), built on first render
+        self._board_cache = None
+        
+        # Last full frame and the visible state it was drawn from; button hover/press
+        # changes mark the frame dirty instead of being part of the key
+        self._frame_cache = None
+        self._last_render_key = None
+        self._dirty = True
         
         # Animation and effects
         self.board_animation_offset = 0
         self.title_glow = 0
         
+        # Frame rate while waiting on a human with nothing on screen moving
+        self.idle_fps = 5
+        self.active_fps = getattr(self.config, 'FPS', 60) if self.config else 60
+        
         # Debug info
         self.debug_info = ""
     
@@ -264,10 +450,11 @@ class AIChessGameState(BaseState):
         
         # Initialize game state
         self.gs = ChessEngine.GameState()
-        self.validMoves = self.gs.getValidMoves()
+        self._update_valid_moves()
         self.moveMade = False
         self.animate = False
         self.gameOver = False
+        self._dirty = True
         
         # Reset player selections
         self.sqSelected = ()
@@ -279,20 +466,20 @@ class AIChessGameState(BaseState):
         self.ai_move = None
         self.ai_thinking_start_time = 0
         
-        # Clean up any existing AI thread
-        if self.ai_thread is not None and self.ai_thread.is_alive():
-            self.ai_thread.join(timeout=1.0)
-        self.ai_thread = None
-        
-        # Clear move queue
-        while not self.move_queue.empty():
-            try:
-                self.move_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Cancel any search left over and make sure the worker thread is running
+        self._cancel_ai_search()
+        with self._ai_cv:
+            self._ai_shutdown = False
+            start_worker = not self._ai_running
+            self._ai_running = True
+        if start_worker:
+            self.ai_thread = threading.Thread(target=self._ai_loop, daemon=True)
+            self.ai_thread.start()
         
         # Load game resources
         self.loadImages()
+        self._selection_overlay = self._build_square_overlay(self.selected_color, 120)
+        self._move_overlay = self._build_square_overlay(self.valid_move_color, 80)
         self.loadFonts()
         self.createUIElements()
         
@@ -302,18 +489,11 @@ class AIChessGameState(BaseState):
     
     def loadFonts(self):
         """Load professional fonts"""
-        try:
-            self.title_font = pygame.font.Font(None, 48)
-            self.subtitle_font = pygame.font.Font(None, 32)
-            self.instruction_font = pygame.font.Font(None, 24)
-            self.info_font = pygame.font.Font(None, 20)
-            self.small_font = pygame.font.Font(None, 16)
-        except:
-            self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
-            self.subtitle_font = pygame.font.SysFont('Arial', 32)
-            self.instruction_font = pygame.font.SysFont('Arial', 24)
-            self.info_font = pygame.font.SysFont('Arial', 20)
-            self.small_font = pygame.font.SysFont('Arial', 16)
+        self.title_font = _get_font(48, bold=True)
+        self.subtitle_font = _get_font(32)
+        self.instruction_font = _get_font(24)
+        self.info_font = _get_font(20)
+        self.small_font = _get_font(16)
     
     def createUIElements(self):
         """Create professional UI elements"""
@@ -358,6 +538,7 @@ class AIChessGameState(BaseState):
                lambda: self.setPlayers(True, True), self.config, 'primary'
             )
         }
+        self._button_list = list(self.buttons.values())
     
     def loadImages(self):
         """Load chess piece images with professional styling"""
@@ -381,56 +562,97 @@ class AIChessGameState(BaseState):
                     raise AttributeError("No resource manager")
             except:
                 self.images[piece] = self.createProfessionalPieceImage(piece)
+        
+        self._build_piece_atlas()
+    
+    def _build_piece_atlas(self):
+        """Copy the twelve piece images side by side into one surface and record each slot"""
+        slot = max(max(image.get_width(), image.get_height()) for image in self.images.values())
+        atlas = pygame.Surface((slot * len(self.images), slot), pygame.SRCALPHA)
+        self._atlas_rects = {}
+        for index, (piece, image) in enumerate(self.images.items()):
+            area = image.get_rect(topleft=(index * slot, 0))
+            atlas.blit(image, area)
+            self._atlas_rects[piece] = area
+        self._atlas = _convert_alpha(atlas)
     
     def createProfessionalPieceImage(self, piece):
         """Create professional piece image using text with shadow"""
-        surface = pygame.Surface((self.SQ_SIZE, self.SQ_SIZE), pygame.SRCALPHA)
+        # Same size as the loaded images, so every piece sits at the same inset in its square
+        piece_size = self.SQ_SIZE - 8
+        center = piece_size // 2
+        surface = pygame.Surface((piece_size, piece_size), pygame.SRCALPHA)
         
         piece_symbols = {
             'wp': '♙', 'wR': '♖', 'wN': '♘', 'wB': '♗', 'wQ': '♕', 'wK': '♔',
             'bp': '♟', 'bR': '♜', 'bN': '♞', 'bB': '♝', 'bQ': '♛', 'bK': '♚'
         }
         
-        font = pygame.font.Font(None, int(self.SQ_SIZE * 0.8))
+        font = _get_font(int(self.SQ_SIZE * 0.8))
         symbol = piece_symbols.get(piece, piece)
         
         # Create shadow
         shadow_color = (0, 0, 0, 100)
         shadow_surface = font.render(symbol, True, (0, 0, 0))
-        shadow_rect = shadow_surface.get_rect(center=(self.SQ_SIZE//2 + 2, self.SQ_SIZE//2 + 2))
+        shadow_rect = shadow_surface.get_rect(center=(center + 2, center + 2))
         
         # Create main piece
         main_color = (255, 255, 255) if piece[0] == 'w' else (50, 50, 50)
         main_surface = font.render(symbol, True, main_color)
-        main_rect = main_surface.get_rect(center=(self.SQ_SIZE//2, self.SQ_SIZE//2))
+        main_rect = main_surface.get_rect(center=(center, center))
         
         # Composite the piece
         surface.blit(shadow_surface, shadow_rect)
         surface.blit(main_surface, main_rect)
         
-        return surface
+        return _convert_alpha(surface)
     
-    def ai_worker(self, game_state_copy, valid_moves_copy):
-        """AI worker function that runs in separate thread"""
+    def _update_valid_moves(self):
+        """Regenerate the valid moves and index them by the square they start from"""
+        self.validMoves = self.gs.getValidMoves()
+        moves_by_start = defaultdict(list)
+        for move in self.validMoves:
+            moves_by_start[(move.startRow, move.startCol)].append(move)
+        self._moves_by_start = dict(moves_by_start)
+    
+    def _ai_loop(self):
+        """Body of the long-lived AI thread: wait for a job, search it, repeat"""
+        while True:
+            with self._ai_cv:
+                self._ai_cv.wait_for(lambda: self._ai_job is not None or self._ai_shutdown)
+                if self._ai_shutdown:
+                    self._ai_running = False
+                    return
+                job = self._ai_job
+                self._ai_job = None
+            self.ai_worker(*job)
+    
+    def ai_worker(self, game_state_copy, valid_moves_copy, cancel):
+        """Search one position on the AI thread and publish the move unless cancelled"""
         try:
             print(f"AI worker started for {'White' if game_state_copy.whiteToMove else 'Black'}")
             
-            # Use the AI to find the best move
-            best_move = ChessAI.findBestMove(game_state_copy, valid_moves_copy, None)
+            # Search deeper until the time budget runs out
+            best_move = ChessAI.findBestMoveTimed(
+                game_state_copy, valid_moves_copy, self.ai_time_budget, cancel=cancel
+            )
             
-            if best_move is None:
+            if best_move is None and not cancel.is_set():
                 # Fallback to random move
                 if len(valid_moves_copy) > 0:
                     best_move = ChessAI.findRandomMove(valid_moves_copy)
             
             print(f"AI worker found move: {best_move}")
             
-            # Put the move in the queue
-            self.move_queue.put(best_move)
-            
         except Exception as e:
             print(f"AI worker error: {e}")
-            self.move_queue.put(None)
+            best_move = None
+        
+        # Hand the move over to the main thread; a cancelled job's answer is dropped
+        with self._ai_cv:
+            if not cancel.is_set():
+                self._ai_result = best_move
+                self._ai_done.set()
     
     def start_ai_thinking(self):
         """Start AI thinking process - FIXED VERSION"""
@@ -447,64 +669,42 @@ class AIChessGameState(BaseState):
         self.ai_thinking_start_time = time.time()
         self.debug_info = f"AI ({current_player}) thinking..."
         
-        # Create a copy of the game state for the AI thread
+        # Give the AI thread its own copy of the position; its search makes and undoes moves on it
         gs_copy = ChessEngine.GameState()
-        gs_copy.board = [row[:] for row in self.gs.board]  # Deep copy
-        gs_copy.whiteToMove = self.gs.whiteToMove
-        gs_copy.moveLog = self.gs.moveLog[:]
-        gs_copy.whiteKingLocation = self.gs.whiteKingLocation
-        gs_copy.blackKingLocation = self.gs.blackKingLocation
-        gs_copy.checkmate = self.gs.checkmate
-        gs_copy.stalemate = self.gs.stalemate
-        gs_copy.enpassantPossible = self.gs.enpassantPossible
-        gs_copy.currentCastlingRights = self.gs.currentCastlingRights
+        gs_copy.restore(self.gs.snapshot())
         
         # Copy valid moves
         valid_moves_copy = self.validMoves[:]
         
-        # Start AI thread
-        self.ai_thread = threading.Thread(
-            target=self.ai_worker, 
-            args=(gs_copy, valid_moves_copy),
-            daemon=True
-        )
-        self.ai_thread.start()
+        # Hand the job to the worker thread
+        with self._ai_cv:
+            self._ai_cancel = threading.Event()
+            self._ai_job = (gs_copy, valid_moves_copy, self._ai_cancel)
+            self._ai_cv.notify()
     
     def check_ai_move(self):
-        """Check if AI has finished thinking - FIXED VERSION"""
-        if not self.ai_thinking:
-            return
-        
-        # Check if enough time has passed
-        thinking_time = time.time() - self.ai_thinking_start_time
-        if thinking_time < self.min_ai_think_time:
-            return  # Still thinking
-        
-        # Check if AI has a move ready
-        try:
-            ai_move = self.move_queue.get_nowait()
-            
-            if ai_move is not None and ai_move in self.validMoves:
-                print(f"AI selected move: {ai_move}")
-                self.ai_move = ai_move
+        """Take the finished AI search result; update() only calls this once _ai_done is set"""
+        ai_move = self._ai_result
+        self._ai_result = None
+        self._ai_done.clear()
+        
+        if ai_move is not None and ai_move in self.validMoves:
+            print(f"AI selected move: {ai_move}")
+            self.ai_move = ai_move
+            self.ai_move_ready = True
+            self.debug_info = f"AI found: {ai_move}"
+        else:
+            print("AI returned invalid move, using random")
+            if len(self.validMoves) > 0:
+                self.ai_move = ChessAI.findRandomMove(self.validMoves)
                 self.ai_move_ready = True
-                self.debug_info = f"AI found: {ai_move}"
+                self.debug_info = f"AI random: {self.ai_move}"
             else:
-                print("AI returned invalid move, using random")
-                if len(self.validMoves) > 0:
-                    self.ai_move = ChessAI.findRandomMove(self.validMoves)
-                    self.ai_move_ready = True
-                    self.debug_info = f"AI random: {self.ai_move}"
-                else:
-                    self.ai_move = None
-                    self.ai_move_ready = False
-            
-            # AI finished thinking
-            self.ai_thinking = False
-            
-        except queue.Empty:
-            # AI still thinking
-            self.debug_info = f"AI thinking... {thinking_time:.1f}s"
+                self.ai_move = None
+                self.ai_move_ready = False
+        
+        # AI finished thinking
+        self.ai_thinking = False
     
     def execute_ai_move(self):
         """Execute the AI move - FIXED VERSION"""
@@ -515,6 +715,7 @@ class AIChessGameState(BaseState):
             self.gs.makeMove(self.ai_move)
             self.moveMade = True
             self.animate = True
+            self._anim_end_time = time.monotonic() + self.move_animation_time
             
             # Reset AI state
             self.ai_move_ready = False
@@ -536,21 +737,32 @@ class AIChessGameState(BaseState):
         """Main game loop update with professional animations"""
         super().update(dt)
         
-        # Update animations
-        self.title_glow = (self.title_glow + dt * 2) % (math.pi * 2)
-        self.board_animation_offset = math.sin(time.time() * 0.5) * 2
+        # Only animate while something is happening on the board
+        needs_anim = self.ai_thinking or self.ai_move_ready or self.moveMade
+        if needs_anim:
+            self.title_glow = (self.title_glow + dt * 2) % (math.pi * 2)
+            self.board_animation_offset = math.sin(time.time() * 0.5) * 2
+        
+        # Tick slowly while a human is to move and nothing is selected
+        idle = not needs_anim and not self.sqSelected and (self.gameOver or not self.is_ai_turn())
+        self.engine.fps = self.idle_fps if idle else self.active_fps
         
         # Update buttons
         mouse_pos = pygame.mouse.get_pos()
-        for button in self.buttons.values():
-            button.update(dt, mouse_pos)
+        for button in self._button_list:
+            if button.update(dt, mouse_pos):
+                self._dirty = True
         
         if self.gameOver:
             return
         
-        # Handle AI thinking
+        # Handle AI thinking: take the result once the worker is done, else show the elapsed time
         if self.ai_thinking:
-            self.check_ai_move()
+            if self._ai_done.is_set():
+                self.check_ai_move()
+            else:
+                thinking_time = time.time() - self.ai_thinking_start_time
+                self.debug_info = f"AI thinking... {thinking_time:.1f}s"
         
         # Execute AI move if ready
         if self.ai_move_ready:
@@ -559,12 +771,13 @@ class AIChessGameState(BaseState):
         # Handle move completion
         if self.moveMade:
             if self.animate:
-                # Add a brief pause for move animation
-                time.sleep(0.2)
+                # Give the move a brief pause on screen without blocking the main loop
+                if time.monotonic() < self._anim_end_time:
+                    return
                 self.animate = False
             
             # Update valid moves
-            self.validMoves = self.gs.getValidMoves()
+            self._update_valid_moves()
             self.moveMade = False
             
             # Check for game over
@@ -587,29 +800,30 @@ class AIChessGameState(BaseState):
     
     def handle_event(self, event):
         """Handle events with professional UI"""
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.WINDOWEXPOSED:
+            # The window contents were lost; the next frame must push the whole screen
+            self._dirty = True
+        elif event.type == pygame.KEYDOWN:
             if event.key == pygame.K_z:  # undo
                 self.undoMove()
             elif event.key == pygame.K_r:  # reset
                 self.resetGame()
         
         # Handle button events
-        for button in self.buttons.values():
-            button.handle_event(event)
+        for button in self._button_list:
+            if button.handle_event(event):
+                self._dirty = True
         
         if event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                location = pygame.mouse.get_pos()
+                location = event.pos
                 
                 # Board click handling - only for human players
                 if (not self.gameOver and not self.ai_thinking and 
                     not self.ai_move_ready and not self.moveMade):
                     
                     # Check if click is on the board
-                    board_rect = pygame.Rect(self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y, 
-                                           self.BOARD_WIDTH, self.BOARD_HEIGHT)
-                    
-                    if board_rect.collidepoint(location):
+                    if self._board_rect.collidepoint(location):
                         col = (location[0] - self.BOARD_OFFSET_X) // self.SQ_SIZE
                         row = (location[1] - self.BOARD_OFFSET_Y) // self.SQ_SIZE
                         
@@ -629,6 +843,7 @@ class AIChessGameState(BaseState):
             self.playerClicks = []
         else:
             self.sqSelected = (row, col)
+            self._selection_own = self.gs.board[row][col][0] == ('w' if self.gs.whiteToMove else 'b')
             self.playerClicks.append(self.sqSelected)
         
         if len(self.playerClicks) == 2:
@@ -636,12 +851,13 @@ class AIChessGameState(BaseState):
             move = ChessEngine.Move(self.playerClicks[0], self.playerClicks[1], self.gs.board)
             
             move_found = False
-            for valid_move in self.validMoves:
+            for valid_move in self._moves_by_start.get(self.playerClicks[0], ()):
                 if move == valid_move:
                     print(f"Human move: {valid_move}")
                     self.gs.makeMove(valid_move)
                     self.moveMade = True
                     self.animate = True
+                    self._anim_end_time = time.monotonic() + self.move_animation_time
                     self.sqSelected = ()
                     self.playerClicks = []
                     move_found = True
@@ -671,6 +887,17 @@ class AIChessGameState(BaseState):
         
         print("Player configuration updated")
     
+    def _cancel_ai_search(self):
+        """Cancel the running or queued search and drop any result it left"""
+        with self._ai_cv:
+            # The worker checks the flag at every node, so there is nothing to join
+            if self._ai_cancel is not None:
+                self._ai_cancel.set()
+                self._ai_cancel = None
+            self._ai_job = None
+            self._ai_result = None
+            self._ai_done.clear()
+    
     def stop_ai_thinking(self):
         """Stop AI thinking completely"""
         print("Stopping AI thinking...")
@@ -679,18 +906,7 @@ class AIChessGameState(BaseState):
         self.ai_move_ready = False
         self.ai_move = None
         
-        # Wait for AI thread to finish
-        if self.ai_thread is not None and self.ai_thread.is_alive():
-            self.ai_thread.join(timeout=2.0)
-            if self.ai_thread.is_alive():
-                print("Warning: AI thread did not stop gracefully")
-        
-        # Clear move queue
-        while not self.move_queue.empty():
-            try:
-                self.move_queue.get_nowait()
-            except queue.Empty:
-                break
+        self._cancel_ai_search()
         
         self.debug_info = "AI stopped"
         print("AI thinking stopped")
@@ -705,7 +921,7 @@ class AIChessGameState(BaseState):
             
             # Undo the move
             self.gs.undoMove()
-            self.validMoves = self.gs.getValidMoves()
+            self._update_valid_moves()
             self.moveMade = False
             self.animate = False
             self.gameOver = False
@@ -725,7 +941,7 @@ class AIChessGameState(BaseState):
         
         # Reset game state
         self.gs = ChessEngine.GameState()
-        self.validMoves = self.gs.getValidMoves()
+        self._update_valid_moves()
         self.sqSelected = ()
         self.playerClicks = []
         self.moveMade = False
@@ -735,8 +951,29 @@ class AIChessGameState(BaseState):
         self.debug_info = "Game reset"
         print("Game reset complete")
     
+    def _render_key(self):
+        """Everything the frame is drawn from; an unchanged key means an identical frame"""
+        moveLog = self.gs.moveLog
+        return (
+            len(moveLog), moveLog[-1] if moveLog else None, self.gs, self.sqSelected,
+            len(self.validMoves), self.gameOver, self.ai_thinking,
+            # the thinking status changes every tenth of a second, so this redraws at most that often
+            self.debug_info,
+            self.playerOne, self.playerTwo,
+            # positions are floored to whole pixels, so the wobble only matters once floored
+            math.floor(self.board_animation_offset),
+        )
+    
     def render(self, screen):
-        """Render the professional game interface"""
+        """Render the professional game interface; returns the screen rects that changed (None: all)"""
+        # Nothing visible changed since the last frame: reuse it, and the display needs no update
+        key = self._render_key()
+        last_key = self._last_render_key
+        partial = not self._dirty and self._frame_cache is not None and last_key is not None
+        if partial and key == last_key:
+            screen.blit(self._frame_cache, (0, 0))
+            return []
+        
         # Get background color from config or use default
         try:
             bg_color = self.config.COLORS['background'] if self.config and hasattr(self.config, 'COLORS') else (248, 249, 250)
@@ -754,8 +991,9 @@ class AIChessGameState(BaseState):
         # Draw pieces
         self.drawPieces(screen, self.gs.board)
         
-        # Draw highlights and overlays
-        self.drawBoardHighlights(screen)
+        # Draw highlights and overlays; nothing to draw until a piece of the side to move is selected
+        if self.sqSelected and self._selection_own:
+            self.drawBoardHighlights(screen)
         
         # Draw status panel
         self.drawStatusPanel(screen)
@@ -769,6 +1007,24 @@ class AIChessGameState(BaseState):
         # Draw game over overlay if needed
         if self.gameOver:
             self.drawGameOverOverlay(screen)
+        
+        if self._frame_cache is None or self._frame_cache.get_size() != screen.get_size():
+            self._frame_cache = screen.copy()
+        else:
+            self._frame_cache.blit(screen, (0, 0))
+        self._last_render_key = key
+        self._dirty = False
+        
+        # Only the board wobble moved: nothing outside the board's sweep differs from last frame
+        if partial and key[:-1] == last_key[:-1]:
+            return [self._board_span(last_key[-1], key[-1])]
+        return None
+    
+    def _board_span(self, offset_a, offset_b):
+        """Screen rect covered by the cached board at either of two whole-pixel wobble offsets"""
+        width, height = self._board_cache.get_size()
+        left = self.BOARD_OFFSET_X - _BOARD_CACHE_LEFT + min(offset_a, offset_b)
+        return pygame.Rect(left, self.BOARD_OFFSET_Y, width + abs(offset_a - offset_b), height)
     
     def drawTitle(self, screen):
         """Draw animated title"""
@@ -779,140 +1035,162 @@ class AIChessGameState(BaseState):
         title_color = (44, 62, 80)
         glow_color = (52, 152, 219, glow_intensity)
         
-        title_surface = self.title_font.render(title_text, True, title_color)
+        title_surface = _render_cached(self.title_font, title_text, title_color)
         title_rect = title_surface.get_rect(center=(self.config.SCREEN_WIDTH // 2 if self.config else 400, 40))
         
-        # Draw glow
-        glow_surface = self.title_font.render(title_text, True, (52, 152, 219))
-        for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            screen.blit(glow_surface, (title_rect.x + offset[0], title_rect.y + offset[1]))
-        
-        # Draw main title
-        screen.blit(title_surface, title_rect)
+        # Draw glow, then the main title on top, in one batch
+        glow_surface = _render_cached(self.title_font, title_text, (52, 152, 219))
+        batch = [(glow_surface, (title_rect.x + dx, title_rect.y + dy)) for dx, dy in _GLOW_OFFSETS]
+        batch.append((title_surface, title_rect))
+        screen.blits(batch, doreturn=False)
     
     def drawProfessionalBoard(self, screen):
         """Draw the professional chess board with matching colors"""
-        # Board background with shadow
-        shadow_rect = pygame.Rect(
-            self.BOARD_OFFSET_X + 4 + self.board_animation_offset,
-            self.BOARD_OFFSET_Y + 4,
-            self.BOARD_WIDTH,
-            self.BOARD_HEIGHT
+        # Shadow, frame, squares and coordinates never change, so they are drawn once and
+        # the whole board is blitted at the wobble offset every frame
+        if self._board_cache is None:
+            self._board_cache = self._build_board_cache()
+        screen.blit(
+            self._board_cache,
+            (self.BOARD_OFFSET_X - _BOARD_CACHE_LEFT + self.board_animation_offset, self.BOARD_OFFSET_Y)
         )
-        pygame.draw.rect(screen, (0, 0, 0, 50), shadow_rect, border_radius=8)
+    
+    def _build_board_cache(self):
+        """Draw shadow, frame, squares and coordinates onto one surface, board at (_BOARD_CACHE_LEFT, 0)"""
+        surface = pygame.Surface(
+            (_BOARD_CACHE_LEFT + self.BOARD_WIDTH + 4, self.BOARD_HEIGHT + _BOARD_CACHE_BOTTOM), pygame.SRCALPHA
+        )
+        board_rect = pygame.Rect(_BOARD_CACHE_LEFT, 0, self.BOARD_WIDTH, self.BOARD_HEIGHT)
+        
+        # Board background with shadow (opaque, as it was when drawn straight to the screen)
+        pygame.draw.rect(surface, (0, 0, 0), board_rect.move(4, 4), border_radius=8)
         
         # Main board background
-        board_bg_rect = pygame.Rect(
-            self.BOARD_OFFSET_X + self.board_animation_offset,
-            self.BOARD_OFFSET_Y,
-            self.BOARD_WIDTH,
-            self.BOARD_HEIGHT
-        )
-        pygame.draw.rect(screen, (60, 60, 60), board_bg_rect, border_radius=8)
-        pygame.draw.rect(screen, (40, 40, 40), board_bg_rect, 3, border_radius=8)
+        pygame.draw.rect(surface, (60, 60, 60), board_rect, border_radius=8)
+        pygame.draw.rect(surface, (40, 40, 40), board_rect, 3, border_radius=8)
+        
+        surface.blit(self._build_board_background(), board_rect)
+        
+        # Draw coordinates
+        self.drawCoordinates(surface, _BOARD_CACHE_LEFT, 0)
+        
+        return _convert_alpha(surface)
+    
+    def _build_board_background(self):
+        """Draw the 64 squares onto an opaque surface the size of the board"""
+        surface = pygame.Surface((self.BOARD_WIDTH, self.BOARD_HEIGHT))
+        # Squares cover 8 * SQ_SIZE; match the frame colour in any leftover strip
+        surface.fill((60, 60, 60))
         
         # Draw squares with professional colors (matching other modules)
-        for row in range(self.DIMENSION):
-            for col in range(self.DIMENSION):
+        sq = self.SQ_SIZE
+        dim = self.DIMENSION
+        offsets = [i * sq for i in range(dim)]
+        light = (self.light_square_color, self._light_shadow)  # (240, 217, 181)
+        dark = (self.dark_square_color, self._dark_shadow)     # (181, 136, 99)
+        for row in range(dim):
+            y = offsets[row]
+            for col in range(dim):
                 # Use the same colors as other modules
-                if (row + col) % 2 == 0:
-                    color = self.light_square_color  # (240, 217, 181)
-                else:
-                    color = self.dark_square_color   # (181, 136, 99)
-                
-                square_rect = pygame.Rect(
-                    self.BOARD_OFFSET_X + col * self.SQ_SIZE + self.board_animation_offset,
-                    self.BOARD_OFFSET_Y + row * self.SQ_SIZE,
-                    self.SQ_SIZE,
-                    self.SQ_SIZE
-                )
+                color, shadow_color = light if (row + col) % 2 == 0 else dark
                 
-                pygame.draw.rect(screen, color, square_rect)
+                square_rect = (offsets[col], y, sq, sq)
+                pygame.draw.rect(surface, color, square_rect)
                 
                 # Add subtle inner shadow for depth
-                shadow_color = tuple(int(c * 0.9) for c in color)
-                pygame.draw.rect(screen, shadow_color, square_rect, 1)
+                pygame.draw.rect(surface, shadow_color, square_rect, 1)
         
-        # Draw coordinates
-        self.drawCoordinates(screen)
+        return surface
     
-    def drawCoordinates(self, screen):
-        """Draw board coordinates professionally"""
+    def drawCoordinates(self, surface, left, top):
+        """Draw board coordinates professionally around a board whose top-left is (left, top)"""
         coord_color = (100, 100, 100)
+        font = self.small_font
+        sq = self.SQ_SIZE
+        half = sq // 2
+        batch = []
         
         # Files (a-h)
+        y = top + self.BOARD_HEIGHT + 5
         for col in range(8):
             letter = chr(ord('a') + col)
-            text_surface = self.small_font.render(letter, True, coord_color)
-            x = self.BOARD_OFFSET_X + col * self.SQ_SIZE + self.SQ_SIZE // 2 + self.board_animation_offset
-            y = self.BOARD_OFFSET_Y + self.BOARD_HEIGHT + 5
-            text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
+            text_surface = _render_cached(font, letter, coord_color)
+            x = left + col * sq + half
+            batch.append((text_surface, text_surface.get_rect(center=(x, y))))
         
         # Ranks (1-8)
+        x = left - 15
         for row in range(8):
             number = str(8 - row)
-            text_surface = self.small_font.render(number, True, coord_color)
-            x = self.BOARD_OFFSET_X - 15 + self.board_animation_offset
-            y = self.BOARD_OFFSET_Y + row * self.SQ_SIZE + self.SQ_SIZE // 2
-            text_rect = text_surface.get_rect(center=(x, y))
-            screen.blit(text_surface, text_rect)
+            text_surface = _render_cached(font, number, coord_color)
+            y = top + row * sq + half
+            batch.append((text_surface, text_surface.get_rect(center=(x, y))))
+        
+        surface.blits(batch, doreturn=False)
     
     def drawBoardHighlights(self, screen):
-        """Draw professional board highlights"""
+        """Draw professional board highlights; the caller only calls this with an own piece selected"""
         # Selected square highlight
-        if self.sqSelected != ():
-            row, col = self.sqSelected
-            if self.gs.board[row][col][0] == ('w' if self.gs.whiteToMove else 'b'):
-                highlight_rect = pygame.Rect(
-                    self.BOARD_OFFSET_X + col * self.SQ_SIZE + self.board_animation_offset,
-                    self.BOARD_OFFSET_Y + row * self.SQ_SIZE,
-                    self.SQ_SIZE,
-                    self.SQ_SIZE
-                )
-                
-                # Create selection overlay
-                selection_surface = pygame.Surface((self.SQ_SIZE, self.SQ_SIZE), pygame.SRCALPHA)
-                pygame.draw.rect(selection_surface, (*self.selected_color, 120), (0, 0, self.SQ_SIZE, self.SQ_SIZE))
-                screen.blit(selection_surface, highlight_rect.topleft)
-                
-                # Selection border
-                pygame.draw.rect(screen, self.selected_color, highlight_rect, 3)
-                
-                # Valid moves highlights
-                for move in self.validMoves:
-                    if move.startRow == row and move.startCol == col:
-                        move_rect = pygame.Rect(
-                            self.BOARD_OFFSET_X + move.endCol * self.SQ_SIZE + self.board_animation_offset,
-                            self.BOARD_OFFSET_Y + move.endRow * self.SQ_SIZE,
-                            self.SQ_SIZE,
-                            self.SQ_SIZE
-                        )
-                        
-                        # Valid move overlay
-                        move_surface = pygame.Surface((self.SQ_SIZE, self.SQ_SIZE), pygame.SRCALPHA)
-                        pygame.draw.rect(move_surface, (*self.valid_move_color, 80), (0, 0, self.SQ_SIZE, self.SQ_SIZE))
-                        screen.blit(move_surface, move_rect.topleft)
-                        
-                        # Valid move border
-                        pygame.draw.rect(screen, self.valid_move_color, move_rect, 2)
+        row, col = self.sqSelected
+        # Plain (x, y, w, h) tuples; draw.rect and blits take them without a Rect per square
+        square_topleft = self._square_topleft
+        sq = self.SQ_SIZE
+        dx = math.floor(self.board_animation_offset)
+        
+        x, y = square_topleft[row * 8 + col]
+        highlight_rect = (x + dx, y, sq, sq)
+        screen.blit(self._selection_overlay, highlight_rect)
+        
+        # Selection border
+        pygame.draw.rect(screen, self.selected_color, highlight_rect, 3)
+        
+        # Valid moves highlights: overlays in one batch, then their borders
+        move_rects = []
+        for move in self._moves_by_start.get((row, col), ()):
+            x, y = square_topleft[move.endRow * 8 + move.endCol]
+            move_rects.append((x + dx, y, sq, sq))
+        move_overlay = self._move_overlay
+        screen.blits([(move_overlay, move_rect) for move_rect in move_rects], doreturn=False)
+        
+        # Valid move border
+        valid_move_color = self.valid_move_color
+        for move_rect in move_rects:
+            pygame.draw.rect(screen, valid_move_color, move_rect, 2)
+    
+    def _build_square_overlay(self, color, alpha):
+        """Translucent square-sized fill used for the selection and valid-move highlights"""
+        overlay = pygame.Surface((self.SQ_SIZE, self.SQ_SIZE), pygame.SRCALPHA)
+        overlay.fill((*color, alpha))
+        return _convert_alpha(overlay)
     
     def drawPieces(self, screen, board):
         """Draw chess pieces with professional styling"""
-        for row in range(self.DIMENSION):
-            for col in range(self.DIMENSION):
-                piece = board[row][col]
-                if piece != "--":
-                    piece_rect = pygame.Rect(
-                        self.BOARD_OFFSET_X + col * self.SQ_SIZE + 4 + self.board_animation_offset,
-                        self.BOARD_OFFSET_Y + row * self.SQ_SIZE + 4,
-                        self.SQ_SIZE - 8,
-                        self.SQ_SIZE - 8
-                    )
-                    screen.blit(self.images[piece], piece_rect)
+        # Every piece comes out of the one atlas surface, so the batch shares a single source
+        atlas = self._atlas
+        atlas_rects = self._atlas_rects
+        dx = 4 + self.board_animation_offset
+        batch = [
+            (atlas, (x + dx, y + 4), atlas_rects[piece])
+            for (x, y), piece in zip(self._square_topleft, chain.from_iterable(board))
+            if piece != "--"
+        ]
+        screen.blits(batch, doreturn=False)
     
     def drawStatusPanel(self, screen):
         """Draw professional status panel"""
+        # Title and lines only change with these; reuse them while the key holds
+        key = (
+            self.gameOver, self.gs.whiteToMove, len(self.gs.moveLog), len(self.validMoves),
+            self.ai_thinking, self.debug_info, self.gs.checkmate, self.gs.stalemate,
+            self.playerOne, self.playerTwo,
+        )
+        if key != self._status_key:
+            self._status_args = self._build_status_content()
+            self._status_key = key
+        self.status_panel.render(screen, *self._status_args)
+    
+    def _build_status_content(self):
+        """Work out the status panel's title, lines and colour scheme"""
         # Determine current game status
         current_player = "White" if self.gs.whiteToMove else "Black"
         player_type = " (AI)" if self.is_ai_turn() else " (Human)"
@@ -944,28 +1222,37 @@ class AIChessGameState(BaseState):
             else:
                 panel_type = 'info'
         
-        self.status_panel.render(screen, title, content, panel_type)
+        return title, content, panel_type
     
     def drawMoveLogPanel(self, screen):
         """Draw professional move log panel"""
         title = "Move History"
         
-        # Format move log
-        move_texts = []
         moveLog = self.gs.moveLog
-        
-        for i in range(0, len(moveLog), 2):
-            move_number = i // 2 + 1
-            white_move = str(moveLog[i]) if i < len(moveLog) else ""
-            black_move = str(moveLog[i + 1]) if i + 1 < len(moveLog) else ""
-            
-            if black_move:
-                move_texts.append(f"{move_number}. {white_move} {black_move}")
-            elif white_move:
-                move_texts.append(f"{move_number}. {white_move}")
-        
-        # Show last 10 moves
-        content = move_texts[-10:] if move_texts else ["No moves yet"]
+        moves = self._move_log_moves
+        strings = self._move_log_strings
+        
+        # Keep the formatted moves that are still in the log, then format only the new ones
+        kept = min(len(moves), len(moveLog))
+        while kept and moves[kept - 1] is not moveLog[kept - 1]:
+            kept -= 1
+        if kept != len(moves) or kept != len(moveLog):
+            del moves[kept:], strings[kept:]
+            moves.extend(moveLog[kept:])
+            strings.extend(str(move) for move in moveLog[kept:])
+            self._move_log_content = None
+        
+        if self._move_log_content is None:
+            # Show last 10 moves
+            move_texts = []
+            for i in range(max(0, len(strings) - 20) & ~1, len(strings), 2):
+                move_number = i // 2 + 1
+                if i + 1 < len(strings):
+                    move_texts.append(f"{move_number}. {strings[i]} {strings[i + 1]}")
+                else:
+                    move_texts.append(f"{move_number}. {strings[i]}")
+            self._move_log_content = move_texts[-10:] if move_texts else ["No moves yet"]
+        content = self._move_log_content
         
         self.move_log_panel.render(screen, title, content, 'info')
     
@@ -980,25 +1267,15 @@ class AIChessGameState(BaseState):
                     button.button_type = 'secondary'
                 else:
                     button.button_type = 'primary'
-            
-            button.render(screen)
+        
+        # Every face and label in one call
+        batch = []
+        for button in self._button_list:
+            batch.extend(button.blit_items())
+        screen.blits(batch, doreturn=False)
     
     def drawGameOverOverlay(self, screen):
         """Draw professional game over overlay"""
-        # Semi-transparent overlay
-        overlay = pygame.Surface((screen.get_width(), screen.get_height()), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (0, 0, 0, 150), overlay.get_rect())
-        screen.blit(overlay, (0, 0))
-        
-        # Game over panel
-        panel_width, panel_height = 400, 200
-        panel_x = (screen.get_width() - panel_width) // 2
-        panel_y = (screen.get_height() - panel_height) // 2
-        
-        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
-        pygame.draw.rect(screen, (255, 255, 255), panel_rect, border_radius=15)
-        pygame.draw.rect(screen, (52, 152, 219), panel_rect, 3, border_radius=15)
-        
         # Game over text
         if self.gs.checkmate:
             winner = "Black" if self.gs.whiteToMove else "White"
@@ -1010,19 +1287,43 @@ class AIChessGameState(BaseState):
             sub_text = "It's a Draw!"
             text_color = (52, 152, 219)
         
-        main_surface = self.subtitle_font.render(main_text, True, text_color)
+        # Dim layer, panel and text only change with the result, so they are composed once
+        key = (screen.get_size(), main_text, sub_text)
+        if key != self._gameover_key:
+            self._gameover_overlay = self._build_gameover_overlay(screen.get_size(), main_text, sub_text, text_color)
+            self._gameover_key = key
+        screen.blit(self._gameover_overlay, (0, 0))
+    
+    def _build_gameover_overlay(self, size, main_text, sub_text, text_color):
+        """Compose the semi-transparent dim layer with the result panel on top"""
+        # Semi-transparent overlay
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        
+        # Game over panel
+        panel_width, panel_height = 400, 200
+        panel_x = (size[0] - panel_width) // 2
+        panel_y = (size[1] - panel_height) // 2
+        
+        panel_rect = pygame.Rect(panel_x, panel_y, panel_width, panel_height)
+        pygame.draw.rect(overlay, (255, 255, 255), panel_rect, border_radius=15)
+        pygame.draw.rect(overlay, (52, 152, 219), panel_rect, 3, border_radius=15)
+        
+        main_surface = _render_cached(self.subtitle_font, main_text, text_color)
         main_rect = main_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 60))
-        screen.blit(main_surface, main_rect)
+        overlay.blit(main_surface, main_rect)
         
-        sub_surface = self.instruction_font.render(sub_text, True, text_color)
+        sub_surface = _render_cached(self.instruction_font, sub_text, text_color)
         sub_rect = sub_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 100))
-        screen.blit(sub_surface, sub_rect)
+        overlay.blit(sub_surface, sub_rect)
         
         # Instructions
         inst_text = "Press 'R' to reset or click Reset Game"
-        inst_surface = self.info_font.render(inst_text, True, (100, 100, 100))
+        inst_surface = _render_cached(self.info_font, inst_text, (100, 100, 100))
         inst_rect = inst_surface.get_rect(center=(panel_x + panel_width // 2, panel_y + 140))
-        screen.blit(inst_surface, inst_rect)
+        overlay.blit(inst_surface, inst_rect)
+        
+        return _convert_alpha(overlay)
     
     def goBack(self):
         """Return to main menu with professional transition"""
@@ -1040,6 +1341,10 @@ class AIChessGameState(BaseState):
         """Clean up when exiting"""
         print("Exiting Professional AI Chess state...")
         self.stop_ai_thinking()
+        with self._ai_cv:
+            self._ai_shutdown = True
+            self._ai_cv.notify()
+        self.engine.fps = self.active_fps
         super().exit()
 
 
@@ -1104,9 +1409,12 @@ if __name__ == "__main__":
             chess_state.handle_event(event)
         
         chess_state.update(dt)
-        chess_state.render(screen)
+        dirty_rects = chess_state.render(screen)
         
-        pygame.display.flip()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
     
     chess_state.exit()
     pygame.quit()
\ No newline at end of file
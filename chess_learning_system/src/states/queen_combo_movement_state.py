@@ -230,34 +230,26 @@ class QueenMovementState(BaseState):
             if directions is None:
                 directions = self.queen_directions
             
-            file = chess.square_file(square)
-            rank = chess.square_rank(square)
-            moves = []
-            
-            # Check all specified directions
-            for df, dr in directions:
-                for distance in range(1, 8):
-                    new_file = file + df * distance
-                    new_rank = rank + dr * distance
-                    
-                    # Check if still on board
-                    if not (0 <= new_file <= 7 and 0 <= new_rank <= 7):
-                        break
-                    
-                    new_square = chess.square(new_file, new_rank)
-                    piece = board.piece_at(new_square)
-                    
-                    if piece is None:
-                        # Empty square - can move here
-                        moves.append(new_square)
-                    else:
-                        # Occupied square - can capture if enemy, then stop
-                        queen_piece = board.piece_at(square)
-                        if queen_piece and piece.color != queen_piece.color:
-                            moves.append(new_square)
-                        break
+            # Sliding attacks come from python-chess's precomputed tables, keyed by the
+            # blockers on each line; directions only selects straight and/or diagonal lines
+            occupied = board.occupied
+            straight = any(df == 0 or dr == 0 for df, dr in directions)
+            diagonal = any(df != 0 and dr != 0 for df, dr in directions)
+            attacks = 0
+            if straight:
+                attacks |= (chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied] |
+                            chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied])
+            if diagonal:
+                attacks |= chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+            
+            # Blockers can be captured if they are enemies; without a piece on square nothing can
+            queen_piece = board.piece_at(square)
+            if queen_piece:
+                attacks &= ~board.occupied_co[queen_piece.color]
+            else:
+                attacks &= ~occupied
             
-            return moves
+            return list(chess.scan_forward(attacks))
         except Exception as e:
             logger.error(f"Error calculating queen moves: {e}")
             return []
@@ -254,12 +254,32 @@ class AnimatedText:
         self.is_complete = False
         
         # Load font
-        if config:
+        self.font = self._load_font(font_size)
+    
+    def _load_font(self, font_size: int) -> pygame.font.Font:
+        """Load the font, through the resource manager cache when configured"""
+        if self.config:
             from src.core.game_engine import ChessEducationEngine
             engine = ChessEducationEngine()
-            self.font = engine.resource_manager.load_font(None, font_size)
-        else:
-            self.font = pygame.font.Font(None, font_size)
+            return engine.resource_manager.load_font(None, font_size)
+        return pygame.font.Font(None, font_size)
+    
+    def reset(self, text: str, pos: Tuple[int, int], font_size: int,
+              color: Tuple[int, int, int], duration: float = 2.0):
+        """Restart this instance with new content so it can be reused"""
+        if font_size != self.font_size:
+            self.font = self._load_font(font_size)
+        self.text = text
+        self.start_pos = pos
+        self.pos = list(pos)
+        self.font_size = font_size
+        self.color = color
+        self.duration = duration
+        
+        self.time = 0
+        self.alpha = 255
+        self.scale = 1.0
+        self.is_complete = False
     
     def update(self, dt: float):
         """Update animation"""